@@ -1,6 +1,7 @@
 """Natural language driven task coordination across Aurora subsystems."""
 import asyncio
 import contextlib
+import itertools
 import json
 import logging
 import time
@@ -106,6 +107,7 @@ class AICoordinator:
 
     async def shutdown(self) -> None:
         await self.queue.stop()
+        await self.cli_agent.close()
 
     async def process_command(self, command: str) -> str:
         lowered = command.lower().strip()
@@ -149,7 +151,7 @@ class AICoordinator:
             return await self._workspace_command(lowered)
 
         if lowered.startswith("screenshot"):
-            data = await self.browser.capture_screenshot()
+            data = await self.browser.capture_screenshot(fmt="jpeg")
             return f"Screenshot captured ({len(data)} bytes)"
 
         return "Command not recognized"
@@ -218,7 +220,7 @@ class AICoordinator:
         tasks = await self.cli_agent.list_tasks(agent=agent_type)
         all_logs = []
         for task in tasks:
-            all_logs.extend(task.logs[-limit:])
+            all_logs.extend(itertools.islice(task.logs, max(len(task.logs) - limit, 0), None))
         return all_logs[-limit:]
 
     def _select_agent(
@@ -0,0 +1,107 @@
+"""Batched append-only log writer for Aurora Pro JSONL streams.
+
+Callers enqueue pre-serialized lines; one background drain task per file
+coalesces whatever arrived within ``FLUSH_INTERVAL`` into a single write,
+issued as one worker-thread job per batch. ``utc_timestamp()`` is the shared
+timestamp for those log lines.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Second-resolution prefix cache for utc_timestamp(); log lines cluster within a second
+_ts_cache = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """UTC timestamp like ``2024-01-01T12:00:00.123Z`` (matches isoformat ms + Z)."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1_000_000:03d}Z"
+
+
+class AsyncAppender:
+    """Owns one append handle and drain task per log path."""
+
+    FLUSH_INTERVAL = 0.05  # seconds a batch is left to accumulate
+    BATCH_MAX = 512  # lines per write
+
+    def __init__(self) -> None:
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    async def put(self, path: str, data: bytes) -> None:
+        """Queue ``data`` (already newline-terminated) for appending to ``path``."""
+        queue = self._queues.get(path)
+        if queue is None:
+            queue = self._queues[path] = asyncio.Queue()
+            self._tasks[path] = asyncio.create_task(self._drain(path, queue))
+        queue.put_nowait(data)
+
+    async def close(self) -> None:
+        """Flush everything queued so far, then close all files."""
+        for queue in self._queues.values():
+            queue.put_nowait(None)
+        if self._tasks:
+            await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._queues.clear()
+        self._tasks.clear()
+
+    @staticmethod
+    def _open(path: str) -> BinaryIO:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return open(path, "ab")
+
+    @staticmethod
+    def _write(fp: BinaryIO, data: bytes) -> None:
+        fp.write(data)
+        fp.flush()
+
+    async def _drain(self, path: str, queue: asyncio.Queue) -> None:
+        fp = None
+        try:
+            fp = await asyncio.to_thread(self._open, path)
+        except Exception as e:
+            logger.error(f"Failed to open log {path}: {e}")
+
+        try:
+            while True:
+                data: Optional[bytes] = await queue.get()
+                if data is None:
+                    return
+                await asyncio.sleep(self.FLUSH_INTERVAL)
+
+                batch = [data]
+                done = False
+                while len(batch) < self.BATCH_MAX and not queue.empty():
+                    data = queue.get_nowait()
+                    if data is None:
+                        done = True
+                        break
+                    batch.append(data)
+
+                if fp is not None:
+                    try:
+                        # write + flush in a single executor round-trip
+                        await asyncio.to_thread(self._write, fp, b"".join(batch))
+                    except Exception as e:
+                        logger.error(f"Failed to write log {path}: {e}")
+                if done:
+                    return
+        finally:
+            if fp is not None:
+                await asyncio.to_thread(fp.close)
+
+
+__all__ = ["AsyncAppender", "utc_timestamp"]
@@ -195,7 +195,7 @@ def analyze_url(app_state: AsyncAppState, url: str) -> Optional[AnalysisResult]:
         analyzer = app_state.analyzer
         if extractor is None or analyzer is None or app_state.database is None:
             return None
-        data = extractor.extract(response.text, url)
+        data = await extractor.extract_async(response.text, url)
         if not data.get("text"):
             return None
         analysis = analyzer.analyze(data["text"], data["title"])
@@ -230,7 +230,7 @@ def render_browser_agent(app_state: AsyncAppState) -> None:
         app_state.run(app_state.browser.new_tab(url))
         st.success("Created new tab")
     if col3.button("Screenshot"):
-        data = app_state.run(app_state.browser.capture_screenshot())
+        data = app_state.run(app_state.browser.capture_screenshot(fmt="jpeg"))
         st.image(Image.open(io.BytesIO(data)), caption="Latest screenshot")
     if col4.button("Export workspaces"):
         snapshot = app_state.run(app_state.browser.export_workspace_state())
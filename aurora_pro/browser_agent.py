@@ -1,10 +1,11 @@
 """Selenium powered browser automation engine with workspace management."""
 import asyncio
+import base64
 import contextlib
 import dataclasses
-import io
 import json
 import logging
+import os
 import pathlib
 import time
 from typing import Dict, List, Optional
@@ -57,6 +58,8 @@ class BrowserAgent:
     def __init__(self, enable_ssrf_protection: bool = True) -> None:
         self._driver: Optional[WebDriver] = None
         self._driver_lock = asyncio.Lock()
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._warmup_options: Optional[tuple] = None
         self._workspaces: Dict[str, BrowserWorkspace] = {}
         self._active_workspace: Optional[str] = None
         self._ssrf_protection = SSRFProtection() if enable_ssrf_protection else None
@@ -70,6 +73,45 @@ class BrowserAgent:
         if not is_valid:
             raise ValueError(f"URL blocked by SSRF protection: {error}")
 
+    @staticmethod
+    def _build_driver(browser: str = "chrome", headless: bool = True) -> WebDriver:
+        """Blocking WebDriver construction; run via ``asyncio.to_thread``."""
+        if browser == "firefox":
+            options = webdriver.FirefoxOptions()
+            options.headless = headless
+            driver_path = None
+            try:
+                driver_path = GeckoDriverManager().install()
+            except Exception:  # noqa: BLE001
+                logger.warning("Falling back to system geckodriver")
+            service = FirefoxService(executable_path=driver_path) if driver_path else FirefoxService()
+            return webdriver.Firefox(options=options, service=service)
+
+        options = ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        driver_path = None
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception:  # noqa: BLE001
+            logger.warning("Falling back to system chromedriver")
+        service = ChromeService(executable_path=driver_path) if driver_path else ChromeService()
+        return webdriver.Chrome(options=options, service=service)
+
+    def warmup(self, browser: str = "chrome", headless: bool = True) -> None:
+        """Start building the WebDriver in the background.
+
+        Call from service startup so driver install/launch overlaps other
+        initialisation; ``ensure_driver`` awaits the in-flight build.
+        """
+        if self._driver or self._warmup_task:
+            return
+        self._warmup_options = (browser, headless)
+        self._warmup_task = asyncio.create_task(asyncio.to_thread(self._build_driver, browser, headless))
+
     async def ensure_driver(self, browser: str = "chrome", headless: bool = True) -> WebDriver:
         """Create a Selenium WebDriver if one is not already active."""
         if self._driver:
@@ -79,37 +121,32 @@ class BrowserAgent:
             if self._driver:
                 return self._driver
 
-            def _build_driver() -> WebDriver:
-                if browser == "firefox":
-                    options = webdriver.FirefoxOptions()
-                    options.headless = headless
-                    driver_path = None
-                    try:
-                        driver_path = GeckoDriverManager().install()
-                    except Exception:  # noqa: BLE001
-                        logger.warning("Falling back to system geckodriver")
-                    service = FirefoxService(executable_path=driver_path) if driver_path else FirefoxService()
-                    return webdriver.Firefox(options=options, service=service)
-
-                options = ChromeOptions()
-                if headless:
-                    options.add_argument("--headless=new")
-                options.add_argument("--disable-gpu")
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                driver_path = None
+            warmup_task = self._warmup_task
+            if warmup_task is not None:
+                # Shielded and left in place until the build finishes, so a
+                # cancelled caller never strands a browser shutdown() can't quit
+                warmed = None
                 try:
-                    driver_path = ChromeDriverManager().install()
-                except Exception:  # noqa: BLE001
-                    logger.warning("Falling back to system chromedriver")
-                service = ChromeService(executable_path=driver_path) if driver_path else ChromeService()
-                return webdriver.Chrome(options=options, service=service)
+                    warmed = await asyncio.shield(warmup_task)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("Background WebDriver warmup failed: %s", exc)
+                self._warmup_task = None
 
-            try:
-                self._driver = await asyncio.to_thread(_build_driver)
-            except WebDriverException as exc:
-                logger.exception("Failed to start WebDriver: %s", exc)
-                raise
+                if warmed is not None and self._warmup_options != (browser, headless):
+                    logger.info("Warmed WebDriver does not match %s (headless=%s); discarding", browser, headless)
+                    try:
+                        await asyncio.to_thread(warmed.quit)
+                    except WebDriverException:
+                        logger.warning("Failed to quit warmed WebDriver", exc_info=True)
+                    warmed = None
+                self._driver = warmed
+
+            if not self._driver:
+                try:
+                    self._driver = await asyncio.to_thread(self._build_driver, browser, headless)
+                except WebDriverException as exc:
+                    logger.exception("Failed to start WebDriver: %s", exc)
+                    raise
 
             self._initialize_workspace("default")
             return self._driver
@@ -194,9 +231,10 @@ class BrowserAgent:
         return True
 
     async def execute_script(self, script: str, *args) -> Optional[str]:
+        # Single read-only command: chromedriver already orders commands per
+        # session, so _driver_lock is reserved for multi-step window sequences.
         driver = await self.ensure_driver()
-        async with self._driver_lock:
-            return await asyncio.to_thread(driver.execute_script, script, *args)
+        return await asyncio.to_thread(driver.execute_script, script, *args)
 
     async def fill_form(self, selector: str, value: str, by: By = By.CSS_SELECTOR) -> bool:
         driver = await self.ensure_driver()
@@ -234,18 +272,40 @@ class BrowserAgent:
 
     async def get_dom(self) -> str:
         driver = await self.ensure_driver()
-        async with self._driver_lock:
-            return await asyncio.to_thread(lambda: driver.execute_script("return document.documentElement.outerHTML"))
-
-    async def capture_screenshot(self, path: Optional[pathlib.Path] = None) -> bytes:
+        return await asyncio.to_thread(driver.execute_script, "return document.documentElement.outerHTML")
+
+    async def capture_screenshot(
+        self,
+        path: Optional[pathlib.Path] = None,
+        fmt: str = "png",
+        quality: int = 80,
+    ) -> bytes:
+        """Capture the viewport, via CDP ``Page.captureScreenshot`` on Chromium.
+
+        ``fmt="jpeg"`` is smaller and cheaper to encode; callers that only need
+        the bytes opt into it. Firefox (no CDP) always falls back to a
+        WebDriver PNG capture.
+        """
         driver = await self.ensure_driver()
 
         def _capture() -> bytes:
-            png = driver.get_screenshot_as_png()
+            if hasattr(driver, "execute_cdp_cmd"):
+                params = {"format": fmt}
+                if fmt == "jpeg":
+                    params["quality"] = quality
+                result = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+                data = base64.b64decode(result["data"])
+            else:
+                data = driver.get_screenshot_as_png()
             if path:
-                with path.open("wb") as handle:
-                    handle.write(png)
-            return png
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            return data
 
         return await asyncio.to_thread(_capture)
 
@@ -257,6 +317,11 @@ class BrowserAgent:
         return json.dumps(data, indent=2)
 
     async def shutdown(self) -> None:
+        if self._warmup_task is not None:
+            # The build thread cannot be cancelled; wait for it so the browser is quit.
+            warmup_task, self._warmup_task = self._warmup_task, None
+            with contextlib.suppress(Exception):
+                self._driver = await warmup_task
         if not self._driver:
             return
         async with self._driver_lock:
@@ -269,27 +334,49 @@ class BrowserAgent:
                 self._workspaces.clear()
                 self._active_workspace = None
 
+    async def _cmd_open(self, rest: str) -> str:
+        if not rest:
+            return "Command not understood"
+        tab = await self.open_url(rest)
+        return f"Opened {tab.title or tab.url}"
+
+    async def _cmd_new(self, rest: str) -> str:
+        if rest[:3].lower() != "tab":
+            return "Command not understood"
+        tab = await self.new_tab()
+        return f"Created tab {tab.handle}"
+
+    async def _cmd_switch(self, rest: str) -> str:
+        if rest[:2].lower() != "to":
+            return "Command not understood"
+        key = rest.partition(" ")[2]
+        tab = await self.switch_tab(key)
+        return f"Switched to {key}" if tab else f"Tab {key} not found"
+
+    async def _cmd_scroll(self, rest: str) -> str:
+        await self.scroll()
+        return "Scrolled page"
+
+    async def _cmd_screenshot(self, rest: str) -> str:
+        data = await self.capture_screenshot(fmt="jpeg")
+        return f"Screenshot captured ({len(data)} bytes)"
+
+    # Verb -> handler table for process_command; only the verb is lowered.
+    _COMMAND_HANDLERS = {
+        "open": _cmd_open,
+        "new": _cmd_new,
+        "switch": _cmd_switch,
+        "scroll": _cmd_scroll,
+        "screenshot": _cmd_screenshot,
+    }
+
     async def process_command(self, command: str) -> str:
         """Very small DSL mapping natural language to browser actions."""
-        lowered = command.lower()
-        if lowered.startswith("open "):
-            url = command.split(" ", 1)[1]
-            tab = await self.open_url(url)
-            return f"Opened {tab.title or tab.url}"
-        if lowered.startswith("new tab"):
-            tab = await self.new_tab()
-            return f"Created tab {tab.handle}"
-        if lowered.startswith("switch to"):
-            key = command.split(" ", 2)[-1]
-            tab = await self.switch_tab(key)
-            return f"Switched to {key}" if tab else f"Tab {key} not found"
-        if lowered.startswith("scroll"):
-            await self.scroll()
-            return "Scrolled page"
-        if lowered.startswith("screenshot"):
-            buffer = io.BytesIO(await self.capture_screenshot())
-            return f"Screenshot captured ({len(buffer.getvalue())} bytes)"
-        return "Command not understood"
+        verb, _, rest = command.partition(" ")
+        handler = self._COMMAND_HANDLERS.get(verb.lower())
+        if handler is None:
+            return "Command not understood"
+        return await handler(self, rest)
 
 
 @contextlib.asynccontextmanager
@@ -22,8 +22,147 @@ import aiofiles
 logger = logging.getLogger(__name__)
 
 
+class _Node:
+    """Intrusive LRU list node."""
+
+    __slots__ = ("prev", "next", "key", "value", "size", "expiry")
+
+    def __init__(self, key: Optional[str] = None, value: Any = None, size: int = 0, expiry: float = 0.0):
+        self.prev: Optional[_Node] = None
+        self.next: Optional[_Node] = None
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expiry = expiry
+
+
 class MemoryCache:
-    """In-memory LRU cache with size limits."""
+    """In-memory LRU cache with size limits.
+
+    Entries live in an intrusive doubly-linked list (most recent at the head)
+    indexed by a plain dict, so a hit is one lookup plus pointer rewrites.
+    """
+
+    def __init__(self, max_size_mb: int = 1024):
+        self._map: Dict[str, _Node] = {}
+        self._head = _Node()
+        self._tail = _Node()
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._max_size_bytes = max_size_mb * 1024 * 1024
+        self._current_size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _unlink(node: _Node) -> None:
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def _push_front(self, node: _Node) -> None:
+        first = self._head.next
+        node.prev = self._head
+        node.next = first
+        first.prev = node
+        self._head.next = node
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache."""
+        async with self._lock:
+            node = self._map.get(key)
+            if node is None:
+                self._misses += 1
+                return None
+            if self._head.next is not node:
+                self._unlink(node)
+                self._push_front(node)
+            self._hits += 1
+            return node.value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Set value in cache."""
+        async with self._lock:
+            # Estimate size
+            try:
+                serialized = pickle.dumps(value)
+                size = len(serialized)
+            except:
+                # Fallback to string length estimate
+                size = len(str(value))
+
+            existing = self._map.pop(key, None)
+            if existing is not None:
+                self._unlink(existing)
+                self._current_size_bytes -= existing.size
+
+            # Evict least recently used entries in one pass from the tail
+            needed = self._current_size_bytes + size - self._max_size_bytes
+            if needed > 0 and self._map:
+                freed = 0
+                evicted = 0
+                victim = self._tail.prev
+                while freed < needed and victim is not self._head:
+                    del self._map[victim.key]
+                    freed += victim.size
+                    evicted += 1
+                    # Drop the links so the evicted run isn't a cycle that keeps
+                    # its values alive until the cyclic GC runs
+                    prev = victim.prev
+                    victim.prev = victim.next = None
+                    victim = prev
+                victim.next = self._tail
+                self._tail.prev = victim
+                self._current_size_bytes -= freed
+                self._evictions += evicted
+
+            # Add new entry
+            expiry = time.time()
+            if ttl:
+                expiry += ttl  # Store expiration time
+
+            node = _Node(key, value, size, expiry)
+            self._map[key] = node
+            self._push_front(node)
+            self._current_size_bytes += size
+
+    async def delete(self, key: str):
+        """Delete key from cache."""
+        async with self._lock:
+            node = self._map.pop(key, None)
+            if node is not None:
+                self._unlink(node)
+                self._current_size_bytes -= node.size
+
+    async def clear(self):
+        """Clear all cache entries."""
+        async with self._lock:
+            for node in self._map.values():
+                node.prev = node.next = None
+            self._map.clear()
+            self._head.next = self._tail
+            self._tail.prev = self._head
+            self._current_size_bytes = 0
+
+    async def get_stats(self) -> Dict:
+        """Get cache statistics."""
+        total_requests = self._hits + self._misses
+        hit_rate = (self._hits / total_requests * 100) if total_requests > 0 else 0.0
+
+        return {
+            "entries": len(self._map),
+            "size_mb": round(self._current_size_bytes / 1024 / 1024, 2),
+            "max_size_mb": round(self._max_size_bytes / 1024 / 1024, 2),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate_percent": round(hit_rate, 2),
+            "evictions": self._evictions,
+        }
+
+
+class OrderedDictMemoryCache:
+    """In-memory LRU cache backed by ``OrderedDict`` (legacy implementation)."""
 
     def __init__(self, max_size_mb: int = 1024):
         self._cache: OrderedDict = OrderedDict()
@@ -58,12 +197,17 @@ class MemoryCache:
                 # Fallback to string length estimate
                 size = len(str(value))
 
-            # Check if we need to evict
-            while self._current_size_bytes + size > self._max_size_bytes and self._cache:
-                # Evict least recently used
-                evict_key, (evict_value, evict_size, evict_ts) = self._cache.popitem(last=False)
-                self._current_size_bytes -= evict_size
-                self._evictions += 1
+            # Evict least recently used entries, settling counters once
+            needed = self._current_size_bytes + size - self._max_size_bytes
+            if needed > 0:
+                freed = 0
+                evicted = 0
+                while freed < needed and self._cache:
+                    _, (_, evict_size, _) = self._cache.popitem(last=False)
+                    freed += evict_size
+                    evicted += 1
+                self._current_size_bytes -= freed
+                self._evictions += evicted
 
             # Add new entry
             timestamp = time.time()
@@ -297,8 +441,10 @@ class CacheManager:
         memory_size_mb: int = DEFAULT_MEMORY_SIZE_MB,
         cache_dir: str = "/root/aurora_pro/cache",
         redis_url: Optional[str] = None,
+        intrusive_lru: bool = True,
     ):
-        self._memory_cache = MemoryCache(max_size_mb=memory_size_mb)
+        memory_cls = MemoryCache if intrusive_lru else OrderedDictMemoryCache
+        self._memory_cache = memory_cls(max_size_mb=memory_size_mb)
         self._disk_cache = DiskCache(cache_dir=cache_dir)
         self._redis_cache = RedisCache(redis_url=redis_url)
         self._running = False
@@ -411,9 +557,11 @@ class CacheManager:
 
     async def get_statistics(self) -> Dict:
         """Get comprehensive cache statistics."""
-        memory_stats = await self._memory_cache.get_stats()
-        disk_stats = await self._disk_cache.get_stats()
-        redis_stats = await self._redis_cache.get_stats()
+        memory_stats, disk_stats, redis_stats = await asyncio.gather(
+            self._memory_cache.get_stats(),
+            self._disk_cache.get_stats(),
+            self._redis_cache.get_stats(),
+        )
 
         return {
             "memory": memory_stats,
@@ -473,4 +621,11 @@ def get_cache_manager(
     return _cache_manager_instance
 
 
-__all__ = ["CacheManager", "get_cache_manager", "MemoryCache", "DiskCache", "RedisCache"]
\ No newline at end of file
+__all__ = [
+    "CacheManager",
+    "get_cache_manager",
+    "MemoryCache",
+    "OrderedDictMemoryCache",
+    "DiskCache",
+    "RedisCache",
+]
\ No newline at end of file
@@ -7,21 +7,78 @@ operator_enabled.yaml configuration.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
+import re
+import threading
 import time
 import uuid
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
-from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 import aiofiles
+import orjson
 import yaml
 
+from async_appender import AsyncAppender, utc_timestamp
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    from twocaptcha import TwoCaptcha
+except ImportError:  # optional - only used when aiohttp is unavailable
+    TwoCaptcha = None
+
+try:
+    import ahocorasick_rs
+except ImportError:  # optional - regex scan is used instead
+    ahocorasick_rs = None
+
 logger = logging.getLogger(__name__)
 
+# CAPTCHA page signatures. Each alternative sits inside a lookahead so that
+# overlapping markers (``google.com/recaptcha/api.js``) are all reported.
+_CAPTCHA_SIGNATURES = (
+    r"(?=(?P<rv3>recaptcha/api\.js|grecaptcha\.execute)"
+    r"|(?P<rv2>google\.com/recaptcha|g-recaptcha)"
+    r"|(?P<hc>hcaptcha\.com|h-captcha))"
+)
+_CAPTCHA_RE = re.compile(_CAPTCHA_SIGNATURES, re.IGNORECASE)
+_CAPTCHA_RE_BYTES = re.compile(_CAPTCHA_SIGNATURES.encode(), re.IGNORECASE)
+
+# Same signatures as a single Aho-Corasick automaton when ahocorasick_rs is installed
+_AC_PATTERNS = (
+    "google.com/recaptcha",
+    "g-recaptcha",
+    "recaptcha/api.js",
+    "grecaptcha.execute",
+    "hcaptcha.com",
+    "h-captcha",
+)
+_AC_KINDS = ("rv2", "rv2", "rv3", "rv3", "hc", "hc")
+if ahocorasick_rs is not None:
+    _CAPTCHA_AC = ahocorasick_rs.AhoCorasick(list(_AC_PATTERNS))
+    _CAPTCHA_AC_BYTES = ahocorasick_rs.BytesAhoCorasick([p.encode() for p in _AC_PATTERNS])
+else:
+    _CAPTCHA_AC = _CAPTCHA_AC_BYTES = None
+
+
+def _signature_kinds(page_source: Union[str, bytes]) -> Set[str]:
+    """Return the CAPTCHA signature kinds (rv2/rv3/hc) present in a page."""
+    if isinstance(page_source, bytes):
+        automaton, pattern = _CAPTCHA_AC_BYTES, _CAPTCHA_RE_BYTES
+    else:
+        automaton, pattern = _CAPTCHA_AC, _CAPTCHA_RE
+
+    if automaton is not None:
+        matches = automaton.find_matches_as_indexes(page_source.lower(), overlapping=True)
+        return {_AC_KINDS[index] for index, _, _ in matches}
+    return {match.lastgroup for match in pattern.finditer(page_source)}
+
 
 class CaptchaType(str, Enum):
     """Supported CAPTCHA types."""
@@ -60,14 +117,38 @@ class CaptchaManager:
     AUDIT_LOG_PATH = "/root/aurora_pro/logs/captcha_manager.log"
     CONFIG_PATH = "/root/aurora_pro/config/operator_enabled.yaml"
     DEFAULT_TIMEOUT = 120  # seconds
-    POLL_INTERVAL = 5  # seconds
+    DEFAULT_MAX_CONCURRENCY = 8  # concurrent solves in solve_many
+    POLL_INTERVAL = 2  # seconds between res.php polls after the first
+    # Wait before the first poll, roughly the average solve time per type
+    INITIAL_WAIT = {
+        CaptchaType.RECAPTCHA_V2: 15,
+        CaptchaType.RECAPTCHA_V3: 10,
+        CaptchaType.HCAPTCHA: 20,
+    }
+    TYPE_LABELS = {
+        CaptchaType.RECAPTCHA_V2: "reCAPTCHA v2",
+        CaptchaType.RECAPTCHA_V3: "reCAPTCHA v3",
+        CaptchaType.HCAPTCHA: "hCaptcha",
+    }
+    SUBMIT_URL = "https://2captcha.com/in.php"
+    RESULT_URL = "https://2captcha.com/res.php"
 
     def __init__(self, api_key: Optional[str] = None):
         self._api_key = api_key
         self._config: Dict = {}
+        self._authorized = False  # derived from config in _load_config
+        self._config_mtime = 0.0
         self._running = False
         self._twocaptcha_available = False
+        self._aiohttp_available = False
+        self._session = None  # aiohttp.ClientSession, created in start()
+        self._solver = None  # cached TwoCaptcha SDK client (fallback path)
+        self._appender = AsyncAppender()  # batched audit log writer
         self._lock = asyncio.Lock()
+        self._solve_sem = asyncio.Semaphore(self.DEFAULT_MAX_CONCURRENCY)
+        # Solve stats; the lock keeps read-modify-write updates and snapshots
+        # consistent even on free-threaded builds
+        self._stats_lock = threading.Lock()
         self._total_cost = 0.0
         self._total_solved = 0
         self._total_failed = 0
@@ -76,127 +157,226 @@ class CaptchaManager:
         """Initialize CAPTCHA manager."""
         self._running = True
         await self._load_config()
+        max_concurrency = self._config.get("captcha", {}).get("max_concurrency", self.DEFAULT_MAX_CONCURRENCY)
+        self._solve_sem = asyncio.Semaphore(max_concurrency)
         await self._check_dependencies()
+        if self._aiohttp_available and self._session is None:
+            import aiohttp
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        if self._session is None and self._twocaptcha_available and self._api_key:
+            # Threaded fallback: bound the SDK's own polling by our timeout so a
+            # stuck solve releases its worker thread like the async path does
+            self._solver = TwoCaptcha(
+                self._api_key,
+                defaultTimeout=self.DEFAULT_TIMEOUT,
+                recaptchaTimeout=self.DEFAULT_TIMEOUT,
+                pollingInterval=self.POLL_INTERVAL,
+            )
         await self._audit_log("system", "CAPTCHA manager started")
 
     async def stop(self):
         """Shutdown CAPTCHA manager."""
         self._running = False
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._solver = None
         await self._audit_log("system", "CAPTCHA manager stopped")
+        await self._appender.close()
 
     async def _load_config(self):
-        """Load operator configuration."""
+        """Load operator configuration and cache the authorization flag."""
         try:
+            self._config_mtime = os.stat(self.CONFIG_PATH).st_mtime
             async with aiofiles.open(self.CONFIG_PATH, "r") as f:
                 content = await f.read()
-                self._config = yaml.safe_load(content)
+                self._config = yaml.load(content, Loader=_YamlLoader)
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             self._config = {"operator_enabled": False, "features": {}}
 
+        self._authorized = bool(self._config.get("operator_enabled", False)) and bool(
+            self._config.get("features", {}).get("captcha_bypass", False)
+        )
+
+    async def _maybe_reload_config(self):
+        """Reload the operator config if the file changed since the last load."""
+        try:
+            mtime = os.stat(self.CONFIG_PATH).st_mtime
+        except OSError:
+            return
+        if mtime != self._config_mtime:
+            await self._load_config()
+
     async def _check_dependencies(self):
-        """Check if 2captcha-python is available."""
+        """Check for aiohttp (native async API client) and 2captcha-python (fallback)."""
         try:
-            from twocaptcha import TwoCaptcha
-            self._twocaptcha_available = True
-            logger.info("2captcha-python available")
+            import aiohttp  # noqa: F401
+            self._aiohttp_available = True
         except ImportError:
+            logger.warning("aiohttp not available - falling back to threaded 2captcha-python")
+            self._aiohttp_available = False
+
+        self._twocaptcha_available = TwoCaptcha is not None
+        if self._twocaptcha_available:
+            logger.info("2captcha-python available")
+        elif not self._aiohttp_available:
             logger.warning("2captcha-python not available")
-            self._twocaptcha_available = False
+
+    @property
+    def _solver_available(self) -> bool:
+        return self._aiohttp_available or self._twocaptcha_available
+
+    async def _submit(self, params: Dict[str, str]) -> str:
+        """Submit a CAPTCHA to in.php and return the 2Captcha request id."""
+        data = {**params, "key": self._api_key, "json": "1"}
+        async with self._session.post(self.SUBMIT_URL, data=data) as resp:
+            payload = await resp.json(content_type=None)
+        if payload.get("status") != 1:
+            raise RuntimeError(f"2Captcha submit failed: {payload.get('request')}")
+        return payload["request"]
+
+    async def _poll(self, request_id: str, initial_wait: float) -> str:
+        """Poll res.php until the CAPTCHA is solved and return the token.
+
+        Sleeps ``initial_wait`` once before the first poll, then polls every
+        ``POLL_INTERVAL`` seconds.
+        """
+        params = {"key": self._api_key, "action": "get", "id": request_id, "json": "1"}
+        deadline = time.monotonic() + self.DEFAULT_TIMEOUT
+        delay = initial_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(delay)
+            delay = self.POLL_INTERVAL
+            async with self._session.get(self.RESULT_URL, params=params) as resp:
+                payload = await resp.json(content_type=None)
+            if payload.get("status") == 1:
+                return payload["request"]
+            if payload.get("request") != "CAPCHA_NOT_READY":
+                raise RuntimeError(f"2Captcha solve failed: {payload.get('request')}")
+        raise asyncio.TimeoutError(f"2Captcha request {request_id} not solved within {self.DEFAULT_TIMEOUT}s")
+
+    async def _solve_remote(
+        self,
+        params: Dict[str, str],
+        sdk_method: str,
+        sdk_kwargs: Dict,
+        initial_wait: float,
+    ) -> str:
+        """Solve through the async HTTP API, or the blocking SDK on a worker thread."""
+        if self._session is not None:
+            request_id = await self._submit(params)
+            return await self._poll(request_id, initial_wait)
+
+        if self._solver is None:
+            raise RuntimeError("CAPTCHA manager not started")
+        result = await asyncio.to_thread(getattr(self._solver, sdk_method), **sdk_kwargs)
+        return result['code']
 
     def _check_authorization(self) -> bool:
         """Check if CAPTCHA bypass is authorized."""
-        operator_enabled = self._config.get("operator_enabled", False)
-        feature_enabled = self._config.get("features", {}).get("captcha_bypass", False)
-        return operator_enabled and feature_enabled
+        return self._authorized
 
-    async def solve_recaptcha_v2(
+    async def _solve(
         self,
-        site_key: str,
-        page_url: str,
-        operator_user: Optional[str] = None,
+        captcha_type: CaptchaType,
+        cost: float,
+        params: Dict[str, str],
+        sdk_method: str,
+        sdk_kwargs: Dict,
+        operator_user: Optional[str],
+        log_meta: Dict,
     ) -> CaptchaSolution:
-        """
-        Solve reCAPTCHA v2.
-
-        Args:
-            site_key: Google site key
-            page_url: URL of page with CAPTCHA
-            operator_user: User requesting operation
-
-        Returns:
-            CaptchaSolution with token
-        """
+        """Shared solve path: gating, timing, stats and audit logging."""
+        await self._maybe_reload_config()
         if not self._check_authorization():
             raise PermissionError("CAPTCHA bypass not authorized - check operator_enabled.yaml")
 
-        if not self._twocaptcha_available:
-            raise RuntimeError("2captcha-python not available - install with: pip install 2captcha-python")
+        if not self._solver_available:
+            raise RuntimeError("No 2Captcha client available - install aiohttp or 2captcha-python")
 
         if not self._api_key:
             raise ValueError("2Captcha API key not provided")
 
+        label = self.TYPE_LABELS[captcha_type]
         task_id = str(uuid.uuid4())
         start_time = time.time()
 
         try:
-            from twocaptcha import TwoCaptcha
-
-            solver = TwoCaptcha(self._api_key)
-
-            # Submit CAPTCHA
-            result = solver.recaptcha(
-                sitekey=site_key,
-                url=page_url,
+            solution_token = await self._solve_remote(
+                params, sdk_method, sdk_kwargs, self.INITIAL_WAIT[captcha_type]
             )
-
             solve_time = time.time() - start_time
-            solution_token = result['code']
-
-            # Estimate cost (reCAPTCHA v2 ~$2.99 per 1000)
-            cost = 0.00299
-
-            solution = CaptchaSolution(
-                task_id=task_id,
-                captcha_type=CaptchaType.RECAPTCHA_V2,
-                solution=solution_token,
-                solve_time_sec=solve_time,
-                cost=cost,
-                status="solved",
-            )
 
             # Update stats
-            self._total_solved += 1
-            self._total_cost += cost
+            with self._stats_lock:
+                self._total_solved += 1
+                self._total_cost += cost
 
             await self._audit_log(
-                "solve_recaptcha_v2",
-                f"Solved reCAPTCHA v2 in {solve_time:.1f}s",
+                f"solve_{captcha_type.value}",
+                f"Solved {label} in {solve_time:.1f}s",
                 operator_user=operator_user,
                 metadata={
                     "task_id": task_id,
-                    "site_key": site_key[:20] + "...",
+                    **log_meta,
                     "solve_time_sec": solve_time,
                     "cost": cost,
                 },
             )
 
-            return solution
+            return CaptchaSolution(
+                task_id=task_id,
+                captcha_type=captcha_type,
+                solution=solution_token,
+                solve_time_sec=solve_time,
+                cost=cost,
+                status="solved",
+            )
 
         except Exception as e:
-            self._total_failed += 1
-            logger.error(f"reCAPTCHA v2 solve failed: {e}")
-            await self._audit_log("error", f"reCAPTCHA v2 solve failed: {e}")
+            with self._stats_lock:
+                self._total_failed += 1
+            logger.error(f"{label} solve failed: {e}")
+            await self._audit_log("error", f"{label} solve failed: {e}")
 
             return CaptchaSolution(
                 task_id=task_id,
-                captcha_type=CaptchaType.RECAPTCHA_V2,
+                captcha_type=captcha_type,
                 solution="",
                 solve_time_sec=time.time() - start_time,
                 cost=0.0,
                 status="failed",
             )
 
+    async def solve_recaptcha_v2(
+        self,
+        site_key: str,
+        page_url: str,
+        operator_user: Optional[str] = None,
+    ) -> CaptchaSolution:
+        """
+        Solve reCAPTCHA v2.
+
+        Args:
+            site_key: Google site key
+            page_url: URL of page with CAPTCHA
+            operator_user: User requesting operation
+
+        Returns:
+            CaptchaSolution with token
+        """
+        # Estimate cost (reCAPTCHA v2 ~$2.99 per 1000)
+        return await self._solve(
+            CaptchaType.RECAPTCHA_V2,
+            0.00299,
+            {"method": "userrecaptcha", "googlekey": site_key, "pageurl": page_url},
+            "recaptcha",
+            {"sitekey": site_key, "url": page_url},
+            operator_user,
+            {"site_key": site_key[:20] + "..."},
+        )
+
     async def solve_recaptcha_v3(
         self,
         site_key: str,
@@ -218,80 +398,23 @@ class CaptchaManager:
         Returns:
             CaptchaSolution with token
         """
-        if not self._check_authorization():
-            raise PermissionError("CAPTCHA bypass not authorized - check operator_enabled.yaml")
-
-        if not self._twocaptcha_available:
-            raise RuntimeError("2captcha-python not available")
-
-        if not self._api_key:
-            raise ValueError("2Captcha API key not provided")
-
-        task_id = str(uuid.uuid4())
-        start_time = time.time()
-
-        try:
-            from twocaptcha import TwoCaptcha
-
-            solver = TwoCaptcha(self._api_key)
-
-            # Submit CAPTCHA
-            result = solver.recaptcha(
-                sitekey=site_key,
-                url=page_url,
-                version='v3',
-                action=action,
-                score=min_score,
-            )
-
-            solve_time = time.time() - start_time
-            solution_token = result['code']
-
-            # Estimate cost (reCAPTCHA v3 ~$2.99 per 1000)
-            cost = 0.00299
-
-            solution = CaptchaSolution(
-                task_id=task_id,
-                captcha_type=CaptchaType.RECAPTCHA_V3,
-                solution=solution_token,
-                solve_time_sec=solve_time,
-                cost=cost,
-                status="solved",
-            )
-
-            # Update stats
-            self._total_solved += 1
-            self._total_cost += cost
-
-            await self._audit_log(
-                "solve_recaptcha_v3",
-                f"Solved reCAPTCHA v3 in {solve_time:.1f}s",
-                operator_user=operator_user,
-                metadata={
-                    "task_id": task_id,
-                    "site_key": site_key[:20] + "...",
-                    "action": action,
-                    "min_score": min_score,
-                    "solve_time_sec": solve_time,
-                    "cost": cost,
-                },
-            )
-
-            return solution
-
-        except Exception as e:
-            self._total_failed += 1
-            logger.error(f"reCAPTCHA v3 solve failed: {e}")
-            await self._audit_log("error", f"reCAPTCHA v3 solve failed: {e}")
-
-            return CaptchaSolution(
-                task_id=task_id,
-                captcha_type=CaptchaType.RECAPTCHA_V3,
-                solution="",
-                solve_time_sec=time.time() - start_time,
-                cost=0.0,
-                status="failed",
-            )
+        # Estimate cost (reCAPTCHA v3 ~$2.99 per 1000)
+        return await self._solve(
+            CaptchaType.RECAPTCHA_V3,
+            0.00299,
+            {
+                "method": "userrecaptcha",
+                "version": "v3",
+                "googlekey": site_key,
+                "pageurl": page_url,
+                "action": action,
+                "min_score": str(min_score),
+            },
+            "recaptcha",
+            {"sitekey": site_key, "url": page_url, "version": "v3", "action": action, "score": min_score},
+            operator_user,
+            {"site_key": site_key[:20] + "...", "action": action, "min_score": min_score},
+        )
 
     async def solve_hcaptcha(
         self,
@@ -310,77 +433,56 @@ class CaptchaManager:
         Returns:
             CaptchaSolution with token
         """
-        if not self._check_authorization():
-            raise PermissionError("CAPTCHA bypass not authorized - check operator_enabled.yaml")
-
-        if not self._twocaptcha_available:
-            raise RuntimeError("2captcha-python not available")
-
-        if not self._api_key:
-            raise ValueError("2Captcha API key not provided")
-
-        task_id = str(uuid.uuid4())
-        start_time = time.time()
-
-        try:
-            from twocaptcha import TwoCaptcha
-
-            solver = TwoCaptcha(self._api_key)
-
-            # Submit CAPTCHA
-            result = solver.hcaptcha(
-                sitekey=site_key,
-                url=page_url,
-            )
-
-            solve_time = time.time() - start_time
-            solution_token = result['code']
-
-            # Estimate cost (hCaptcha ~$2.99 per 1000)
-            cost = 0.00299
-
-            solution = CaptchaSolution(
-                task_id=task_id,
-                captcha_type=CaptchaType.HCAPTCHA,
-                solution=solution_token,
-                solve_time_sec=solve_time,
-                cost=cost,
-                status="solved",
-            )
-
-            # Update stats
-            self._total_solved += 1
-            self._total_cost += cost
-
-            await self._audit_log(
-                "solve_hcaptcha",
-                f"Solved hCaptcha in {solve_time:.1f}s",
-                operator_user=operator_user,
-                metadata={
-                    "task_id": task_id,
-                    "site_key": site_key[:20] + "...",
-                    "solve_time_sec": solve_time,
-                    "cost": cost,
-                },
-            )
+        # Estimate cost (hCaptcha ~$2.99 per 1000)
+        return await self._solve(
+            CaptchaType.HCAPTCHA,
+            0.00299,
+            {"method": "hcaptcha", "sitekey": site_key, "pageurl": page_url},
+            "hcaptcha",
+            {"sitekey": site_key, "url": page_url},
+            operator_user,
+            {"site_key": site_key[:20] + "..."},
+        )
+
+    def _resolve_request(self, request: Dict) -> Tuple[Callable, Dict]:
+        """Map one ``solve_many`` request to its ``solve_*`` method and kwargs."""
+        kwargs = dict(request)
+        captcha_type = CaptchaType(kwargs.pop("captcha_type"))
+        if captcha_type == CaptchaType.RECAPTCHA_V2:
+            solve = self.solve_recaptcha_v2
+        elif captcha_type == CaptchaType.RECAPTCHA_V3:
+            solve = self.solve_recaptcha_v3
+        elif captcha_type == CaptchaType.HCAPTCHA:
+            solve = self.solve_hcaptcha
+        else:
+            raise ValueError(f"Unsupported CAPTCHA type for solve_many: {captcha_type.value}")
+        return solve, kwargs
+
+    async def _dispatch(self, solve: Callable, kwargs: Dict) -> CaptchaSolution:
+        """Run one ``solve_many`` request under the concurrency semaphore."""
+        async with self._solve_sem:
+            return await solve(**kwargs)
+
+    async def solve_many(self, requests: List[Dict]) -> List[CaptchaSolution]:
+        """
+        Solve several CAPTCHAs concurrently.
 
-            return solution
+        Args:
+            requests: Dicts with ``captcha_type`` plus the keyword arguments of
+                the matching ``solve_*`` method (``site_key``, ``page_url``, ...)
 
-        except Exception as e:
-            self._total_failed += 1
-            logger.error(f"hCaptcha solve failed: {e}")
-            await self._audit_log("error", f"hCaptcha solve failed: {e}")
+        Returns:
+            CaptchaSolutions in request order
 
-            return CaptchaSolution(
-                task_id=task_id,
-                captcha_type=CaptchaType.HCAPTCHA,
-                solution="",
-                solve_time_sec=time.time() - start_time,
-                cost=0.0,
-                status="failed",
-            )
+        Raises:
+            ValueError: if any request has an unsupported ``captcha_type``;
+                nothing is submitted in that case
+        """
+        # Validate the whole batch first so bad input never leaves paid jobs running
+        resolved = [self._resolve_request(request) for request in requests]
+        return list(await asyncio.gather(*(self._dispatch(solve, kwargs) for solve, kwargs in resolved)))
 
-    async def detect_captcha_type(self, page_source: str) -> Optional[CaptchaType]:
+    async def detect_captcha_type(self, page_source: Union[str, bytes]) -> Optional[CaptchaType]:
         """
         Auto-detect CAPTCHA type from page source.
 
@@ -390,32 +492,31 @@ class CaptchaManager:
         Returns:
             Detected CAPTCHA type or None
         """
-        page_lower = page_source.lower()
+        kinds = _signature_kinds(page_source)
 
-        # Check for reCAPTCHA
-        if 'google.com/recaptcha' in page_lower or 'g-recaptcha' in page_lower:
-            if 'recaptcha/api.js' in page_lower or 'grecaptcha.execute' in page_lower:
+        if "rv2" in kinds:
+            if "rv3" in kinds:
                 return CaptchaType.RECAPTCHA_V3
             return CaptchaType.RECAPTCHA_V2
-
-        # Check for hCaptcha
-        if 'hcaptcha.com' in page_lower or 'h-captcha' in page_lower:
+        if "hc" in kinds:
             return CaptchaType.HCAPTCHA
-
         return None
 
     def get_statistics(self) -> Dict:
         """Get CAPTCHA solving statistics."""
-        total_attempts = self._total_solved + self._total_failed
-        success_rate = (self._total_solved / total_attempts * 100) if total_attempts > 0 else 0.0
+        with self._stats_lock:
+            solved, failed, cost = self._total_solved, self._total_failed, self._total_cost
+
+        total_attempts = solved + failed
+        success_rate = (solved / total_attempts * 100) if total_attempts > 0 else 0.0
 
         return {
-            "total_solved": self._total_solved,
-            "total_failed": self._total_failed,
+            "total_solved": solved,
+            "total_failed": failed,
             "total_attempts": total_attempts,
             "success_rate_percent": round(success_rate, 2),
-            "total_cost_usd": round(self._total_cost, 4),
-            "average_cost_per_solve": round(self._total_cost / self._total_solved, 4) if self._total_solved > 0 else 0.0,
+            "total_cost_usd": round(cost, 4),
+            "average_cost_per_solve": round(cost / solved, 4) if solved > 0 else 0.0,
         }
 
     def get_status(self) -> Dict:
@@ -423,6 +524,7 @@ class CaptchaManager:
         return {
             "running": self._running,
             "twocaptcha_available": self._twocaptcha_available,
+            "async_client": self._session is not None,
             "api_key_configured": self._api_key is not None,
             "authorized": self._check_authorization(),
             "statistics": self.get_statistics(),
@@ -436,7 +538,7 @@ class CaptchaManager:
         metadata: Optional[Dict] = None,
     ):
         """Write audit log entry."""
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+        timestamp = utc_timestamp()
 
         entry = {
             "timestamp": timestamp,
@@ -446,16 +548,9 @@ class CaptchaManager:
             "metadata": metadata or {},
         }
 
-        line = json.dumps(entry) + "\n"
-
-        log_path = Path(self.AUDIT_LOG_PATH)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
 
-        try:
-            async with aiofiles.open(self.AUDIT_LOG_PATH, "a") as f:
-                await f.write(line)
-        except Exception as e:
-            logger.error(f"Failed to write audit log: {e}")
+        await self._appender.put(self.AUDIT_LOG_PATH, line)
 
 
 # Singleton instance
@@ -4,18 +4,32 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 import hashlib
-import json
+import itertools
 import os
 import shlex
 import time
 import uuid
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import aiofiles
+import orjson
+
+from async_appender import AsyncAppender, utc_timestamp
+
+
+# Line prefixes for stream entries in task logfiles
+_STREAM_TAGS = {"stdout": "O", "stderr": "E", "system": "S"}
+
+
+def _encode_lines(parts: List[str]) -> Iterator[bytes]:
+    """Yield each part UTF-8 encoded and newline terminated, for writelines()."""
+    for part in parts:
+        yield part.encode("utf-8", errors="replace")
+        yield b"\n"
 
 
 class AgentType(str, Enum):
@@ -24,7 +38,7 @@ class AgentType(str, Enum):
     CODEX = "codex"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class CLITask:
     """Task record for CLI agent execution."""
     id: str
@@ -37,23 +51,28 @@ class CLITask:
     timeout: int = 300
     result: Optional[str] = None
     error: Optional[str] = None
-    logs: List[Dict[str, str]] = dataclasses.field(default_factory=list)
+    # Recent entries only; the full stream is written to the task logfile
+    logs: Deque[Dict[str, str]] = dataclasses.field(default_factory=lambda: deque(maxlen=200))
     operator_user: Optional[str] = None
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "agent": self.agent.value,
-            "prompt": self.prompt,
-            "status": self.status,
-            "created_at": self.created_at,
-            "started_at": self.started_at,
-            "finished_at": self.finished_at,
-            "timeout": self.timeout,
-            "result": self.result,
-            "error": self.error,
-            "logs": self.logs,
-        }
+    prompt_sha256: str = ""
+    stdout_lines: int = 0
+    stderr_lines: int = 0
+
+    # Serialized attributes, in output order ("agent" is replaced by its value)
+    _DICT_FIELDS = (
+        "id", "agent", "prompt", "status", "created_at", "started_at",
+        "finished_at", "timeout", "result", "error",
+    )
+
+    def to_dict(self, log_limit: Optional[int] = None) -> dict:
+        data = {name: getattr(self, name) for name in self._DICT_FIELDS}
+        data["agent"] = self.agent.value
+        logs = self.logs
+        if log_limit is not None and len(logs) > log_limit:
+            data["logs"] = list(itertools.islice(logs, len(logs) - log_limit, None))
+        else:
+            data["logs"] = list(logs)
+        return data
 
 
 class CLIAgent:
@@ -67,15 +86,34 @@ class CLIAgent:
     AUDIT_LOG_PATH = "/root/aurora_pro/logs/cli_agent_audit.log"
     CODEX_ACTIVITY_LOG = "/root/aurora_pro/logs/codex_activity.log"
     TASK_LOG_DIR = "/root/aurora_pro/logs/tasks"
-
-    def __init__(self) -> None:
+    READ_CHUNK_SIZE = 64 * 1024
+    RESULT_TAIL_BYTES = 64 * 1024
+    STATUS_LOG_LIMIT = 20  # log entries per task in status() payloads
+
+    def __init__(self, direct_stdout_agents: Iterable[AgentType] = ()) -> None:
+        """
+        Args:
+            direct_stdout_agents: Agents whose stdout file descriptor is the
+                ``<task>.stdout`` file itself, so the kernel writes output
+                without copying it through Python. Their ``result`` is the last
+                ``RESULT_TAIL_BYTES`` of that file and stdout lines are not
+                mirrored into the task log.
+        """
+        self._direct_stdout_agents = frozenset(direct_stdout_agents)
         self._agents: Dict[AgentType, asyncio.Semaphore] = {
             AgentType.CLAUDE: asyncio.Semaphore(1),
             AgentType.CODEX: asyncio.Semaphore(1),
         }
-        self._history: deque = deque(maxlen=self.HISTORY_MAX)
-        self._tasks: Dict[str, CLITask] = {}
+        # Insertion-ordered, capped at HISTORY_MAX (oldest evicted first)
+        self._tasks: OrderedDict[str, CLITask] = OrderedDict()
         self._lock = asyncio.Lock()
+        self._appender = AsyncAppender()  # batched audit / Codex activity JSONL
+        self._task_fps: Dict[str, object] = {}  # task id -> open task logfile
+        self._task_log_dir_ready = False
+
+    async def close(self) -> None:
+        """Flush and close the JSONL log writers."""
+        await self._appender.close()
 
     async def submit_task(
         self,
@@ -93,10 +131,12 @@ class CLIAgent:
             prompt=prompt,
             timeout=timeout or self.TIMEOUT_DEFAULT,
             operator_user=operator_user,
+            prompt_sha256=hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
         )
         async with self._lock:
             self._tasks[task_id] = task
-            self._history.append(task_id)
+            if len(self._tasks) > self.HISTORY_MAX:
+                self._tasks.popitem(last=False)
         await self._audit_log(task, "queued")
         asyncio.create_task(self._execute_task(task))
         return task
@@ -107,25 +147,28 @@ class CLIAgent:
 
     async def list_tasks(self, agent: Optional[AgentType] = None) -> List[CLITask]:
         """List recent tasks, optionally filtered by agent."""
-        tasks = [self._tasks[tid] for tid in self._history if tid in self._tasks]
+        tasks = list(self._tasks.values())
         if agent:
             tasks = [t for t in tasks if t.agent == agent]
         return tasks
 
     def status(self) -> Dict[str, dict]:
         """Return status summary for all agents."""
-        summary = {}
-        for agent_type in AgentType:
-            sem = self._agents[agent_type]
-            tasks = [t for t in self._history if self._tasks.get(t, CLITask("", agent_type, "")).agent == agent_type]
-            task_list = [self._tasks[tid].to_dict() for tid in tasks if tid in self._tasks]
-            running = [t for t in task_list if t["status"] == "running"]
-            summary[agent_type.value] = {
-                "available": sem._value,
-                "running": running[0]["id"] if running else None,
-                "tasks": task_list,
+        task_lists: Dict[AgentType, List[dict]] = {agent_type: [] for agent_type in AgentType}
+        running: Dict[AgentType, Optional[str]] = dict.fromkeys(AgentType)
+        for task in self._tasks.values():
+            task_lists[task.agent].append(task.to_dict(log_limit=self.STATUS_LOG_LIMIT))
+            if task.status == "running" and running[task.agent] is None:
+                running[task.agent] = task.id
+
+        return {
+            agent_type.value: {
+                "available": self._agents[agent_type]._value,
+                "running": running[agent_type],
+                "tasks": task_lists[agent_type],
             }
-        return summary
+            for agent_type in AgentType
+        }
 
     async def _execute_task(self, task: CLITask) -> None:
         """Execute task with semaphore-based concurrency control."""
@@ -133,10 +176,11 @@ class CLIAgent:
         async with sem:
             task.status = "running"
             task.started_at = time.time()
-            await self._append_log(task, "system", "Task started")
-            await self._audit_log(task, "running")
 
             try:
+                await self._open_task_log(task)
+                await self._append_log(task, "system", "Task started")
+                await self._audit_log(task, "running")
                 await self._run_subprocess(task)
             except asyncio.TimeoutError:
                 task.status = "timeout"
@@ -154,17 +198,25 @@ class CLIAgent:
     async def _run_subprocess(self, task: CLITask) -> None:
         """Spawn CLI subprocess and capture output."""
         command = self._build_command(task.agent)
+        stdout_path = Path(self.TASK_LOG_DIR) / f"{task.id}.stdout"
+        stdout_fd = None
+        if task.agent in self._direct_stdout_agents:
+            stdout_fd = os.open(stdout_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
             proc = await asyncio.create_subprocess_exec(
                 *command,
                 stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
+                stdout=stdout_fd if stdout_fd is not None else asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
         except FileNotFoundError:
             raise RuntimeError(f"CLI binary '{task.agent.value}' not found in PATH")
+        finally:
+            # The child holds its own copy of the descriptor
+            if stdout_fd is not None:
+                os.close(stdout_fd)
 
-        assert proc.stdin and proc.stdout and proc.stderr
+        assert proc.stdin and proc.stderr
         proc.stdin.write(task.prompt.encode("utf-8", errors="replace"))
         proc.stdin.write(b"\n")
         await proc.stdin.drain()
@@ -174,16 +226,26 @@ class CLIAgent:
         stderr_lines = []
 
         async def _read_stream(stream: asyncio.StreamReader, stream_name: str, collector: List[str]) -> None:
-            while True:
-                line = await stream.readline()
-                if not line:
-                    break
-                text = line.decode("utf-8", errors="replace").rstrip()
+            buf = b""
+            while chunk := await stream.read(self.READ_CHUNK_SIZE):
+                lines = (buf + chunk).split(b"\n")
+                buf = lines.pop()
+                if lines:
+                    texts = [line.decode("utf-8", errors="replace").rstrip() for line in lines]
+                    collector.extend(texts)
+                    await self._append_logs(task, stream_name, texts)
+            if buf:
+                text = buf.decode("utf-8", errors="replace").rstrip()
                 collector.append(text)
                 await self._append_log(task, stream_name, text)
+            if stream_name == "stdout":
+                task.stdout_lines = len(collector)
+            else:
+                task.stderr_lines = len(collector)
 
-        stdout_task = asyncio.create_task(_read_stream(proc.stdout, "stdout", stdout_lines))
-        stderr_task = asyncio.create_task(_read_stream(proc.stderr, "stderr", stderr_lines))
+        readers = [asyncio.create_task(_read_stream(proc.stderr, "stderr", stderr_lines))]
+        if proc.stdout is not None:
+            readers.append(asyncio.create_task(_read_stream(proc.stdout, "stdout", stdout_lines)))
 
         try:
             await asyncio.wait_for(proc.wait(), timeout=task.timeout)
@@ -192,18 +254,31 @@ class CLIAgent:
             await proc.wait()
             raise
         finally:
-            await asyncio.gather(stdout_task, stderr_task, return_exceptions=True)
+            await asyncio.gather(*readers, return_exceptions=True)
 
         exit_code = proc.returncode
         if exit_code == 0:
             task.status = "completed"
-            task.result = "\n".join(stdout_lines)
+            if proc.stdout is None:
+                size, tail = await asyncio.to_thread(self._read_tail, stdout_path, self.RESULT_TAIL_BYTES)
+                task.result = tail.decode("utf-8", errors="replace").rstrip()
+                await self._append_log(task, "system", f"Stdout ({size} bytes) written to {stdout_path}")
+            else:
+                task.result = "\n".join(stdout_lines)
             await self._append_log(task, "system", "Task completed successfully")
         else:
             task.status = "error"
             task.error = "\n".join(stderr_lines) or f"Exit code {exit_code}"
             await self._append_log(task, "system", f"Failed with exit code {exit_code}")
 
+    @staticmethod
+    def _read_tail(path: Path, limit: int) -> Tuple[int, bytes]:
+        """Return (file size, last ``limit`` bytes) of a file."""
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            handle.seek(max(size - limit, 0))
+            return size, handle.read()
+
     def _build_command(self, agent: AgentType) -> List[str]:
         """Build shell-safe command list for agent."""
         env_key = f"{agent.value.upper()}_CLI_CMD"
@@ -214,12 +289,10 @@ class CLIAgent:
         self,
         task: CLITask,
         output_path: Path,
-        stdout_lines: List[str],
-        stderr_lines: List[str],
     ) -> None:
         """Write structured JSONL entry for Codex tasks."""
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
-        prompt_hash = hashlib.sha256(task.prompt.encode("utf-8")).hexdigest()
+        timestamp = utc_timestamp()
+        prompt_hash = task.prompt_sha256
 
         # Calculate duration and exit code
         duration = 0.0
@@ -255,29 +328,32 @@ class CLIAgent:
             "output_path": str(output_path),
             "elevation_used": elevation_used,
             "input_summary": input_summary,
-            "stderr_lines": len(stderr_lines),
-            "stdout_lines": len(stdout_lines),
+            "stderr_lines": task.stderr_lines,
+            "stdout_lines": task.stdout_lines,
         }
 
-        line = json.dumps(entry) + "\n"
-
-        # Ensure log exists
-        log_path = Path(self.CODEX_ACTIVITY_LOG)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
 
-        async with aiofiles.open(self.CODEX_ACTIVITY_LOG, "a") as f:
-            await f.write(line)
+        await self._appender.put(self.CODEX_ACTIVITY_LOG, line)
 
     async def _append_log(self, task: CLITask, stream: str, message: str) -> None:
-        """Append log entry to task."""
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
-        entry = {"timestamp": timestamp, "stream": stream, "message": message}
-        task.logs.append(entry)
+        """Append log entry to task and its logfile."""
+        await self._append_logs(task, stream, [message])
+
+    async def _append_logs(self, task: CLITask, stream: str, messages: List[str]) -> None:
+        """Append a batch of log entries read together, sharing one timestamp."""
+        timestamp = utc_timestamp()
+        task.logs.extend({"timestamp": timestamp, "stream": stream, "message": message} for message in messages)
+
+        fp = self._task_fps.get(task.id)
+        if fp is not None:
+            prefix = f"{_STREAM_TAGS.get(stream, 'S')} {timestamp} "
+            await fp.write("".join(f"{prefix}{message}\n" for message in messages).encode("utf-8", errors="replace"))
 
     async def _audit_log(self, task: CLITask, status: str) -> None:
         """Write audit log entry."""
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
-        prompt_hash = hashlib.sha256(task.prompt.encode("utf-8")).hexdigest()
+        timestamp = utc_timestamp()
+        prompt_hash = task.prompt_sha256
         duration = None
         if task.started_at and task.finished_at:
             duration = round(task.finished_at - task.started_at, 3)
@@ -291,60 +367,67 @@ class CLIAgent:
             "duration_sec": duration,
             "operator_user": task.operator_user,
         }
-        line = json.dumps(entry) + "\n"
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
 
-        async with aiofiles.open(self.AUDIT_LOG_PATH, "a") as f:
-            await f.write(line)
+        await self._appender.put(self.AUDIT_LOG_PATH, line)
 
-    async def _save_task_log(self, task: CLITask) -> None:
-        """Persist full task logs to dedicated file with structured format."""
+    async def _open_task_log(self, task: CLITask) -> None:
+        """Open the task logfile and write its header; output is streamed in after it."""
         log_path = Path(self.TASK_LOG_DIR) / f"{task.id}.log"
 
-        # Separate stdout and stderr
-        stdout_lines = [log["message"] for log in task.logs if log["stream"] == "stdout"]
-        stderr_lines = [log["message"] for log in task.logs if log["stream"] == "stderr"]
-
-        # Build structured log content
         content_parts = []
         content_parts.append("=" * 80)
         content_parts.append(f"TASK ID: {task.id}")
         content_parts.append(f"AGENT: {task.agent.value}")
-        content_parts.append(f"STATUS: {task.status}")
         content_parts.append(f"CREATED: {datetime.utcfromtimestamp(task.created_at).isoformat()}Z")
         if task.started_at:
             content_parts.append(f"STARTED: {datetime.utcfromtimestamp(task.started_at).isoformat()}Z")
-        if task.finished_at:
-            content_parts.append(f"FINISHED: {datetime.utcfromtimestamp(task.finished_at).isoformat()}Z")
-            duration = task.finished_at - task.started_at if task.started_at else 0
-            content_parts.append(f"DURATION: {duration:.3f}s")
         content_parts.append(f"TIMEOUT: {task.timeout}s")
         content_parts.append(f"OPERATOR: {task.operator_user or 'N/A'}")
         content_parts.append("=" * 80)
         content_parts.append("")
 
-        # Prompt (first 200 chars)
+        # Prompt (first 500 chars)
         content_parts.append("PROMPT:")
         content_parts.append(task.prompt[:500] + ("..." if len(task.prompt) > 500 else ""))
         content_parts.append("")
 
-        # STDOUT section
+        # Output section: one line per entry, tagged O (stdout), E (stderr) or S (system)
         content_parts.append("=" * 80)
-        content_parts.append("STDOUT")
+        content_parts.append("OUTPUT")
         content_parts.append("=" * 80)
-        if stdout_lines:
-            content_parts.extend(stdout_lines)
-        else:
-            content_parts.append("(no stdout)")
-        content_parts.append("")
 
-        # STDERR section
+        if not self._task_log_dir_ready:
+            Path(self.TASK_LOG_DIR).mkdir(parents=True, exist_ok=True)
+            self._task_log_dir_ready = True
+        fp = await aiofiles.open(log_path, "wb")
+        await fp.writelines(_encode_lines(content_parts))
+        self._task_fps[task.id] = fp
+
+    async def _save_task_log(self, task: CLITask) -> None:
+        """Append the result trailer to the task logfile and close it."""
+        log_path = Path(self.TASK_LOG_DIR) / f"{task.id}.log"
+        fp = self._task_fps.pop(task.id, None)
+        # No handle when _open_task_log failed; the activity entry is still written
+        if fp is not None:
+            await self._write_task_trailer(task, fp)
+
+        # If Codex agent, write structured JSONL entry
+        if task.agent == AgentType.CODEX and task.finished_at:
+            await self._write_codex_activity_log(task, log_path)
+
+    async def _write_task_trailer(self, task: CLITask, fp) -> None:
+        """Write the status/result trailer to an open task logfile and close it."""
+        content_parts = [""]
         content_parts.append("=" * 80)
-        content_parts.append("STDERR")
+        content_parts.append(f"STATUS: {task.status}")
+        if task.finished_at:
+            content_parts.append(f"FINISHED: {datetime.utcfromtimestamp(task.finished_at).isoformat()}Z")
+            duration = task.finished_at - task.started_at if task.started_at else 0
+            content_parts.append(f"DURATION: {duration:.3f}s")
+        content_parts.append(f"STDOUT LINES: {task.stdout_lines}")
+        content_parts.append(f"STDERR LINES: {task.stderr_lines}")
         content_parts.append("=" * 80)
-        if stderr_lines:
-            content_parts.extend(stderr_lines)
-        else:
-            content_parts.append("(no stderr)")
         content_parts.append("")
 
         # Result/Error
@@ -362,13 +445,11 @@ class CLIAgent:
             content_parts.append(task.error)
             content_parts.append("")
 
-        # Write to file
-        async with aiofiles.open(log_path, "w") as f:
-            await f.write("\n".join(content_parts))
-
-        # If Codex agent, write structured JSONL entry
-        if task.agent == AgentType.CODEX and task.finished_at:
-            await self._write_codex_activity_log(task, log_path, stdout_lines, stderr_lines)
+        try:
+            # Encoded part by part so a large RESULT never exists as one joined string
+            await fp.writelines(_encode_lines(content_parts))
+        finally:
+            await fp.close()
 
 
 __all__ = ["CLIAgent", "CLITask", "AgentType"]
\ No newline at end of file
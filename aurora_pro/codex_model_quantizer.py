@@ -46,5 +46,7 @@ class CodexModelQuantizer:
             """,
         ]
 
-        return await self.codex.infrastructure_deployment(tasks)
+        # Both conversions need the toolkit; the vLLM env change is independent
+        deps = [[], [0], [0], []]
+        return await self.codex.infrastructure_deployment(tasks, deps=deps)
 
@@ -1,17 +1,100 @@
 import asyncio
+import contextlib
+import itertools
 import json
 import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+
+from .async_appender import AsyncAppender
+
+
+async def _readline(stream: asyncio.StreamReader) -> bytes:
+    """Read one line of any length; b"" at EOF.
+
+    Lines longer than the stream's limit are gathered in pieces instead of
+    raising, so one oversized line never aborts the reader.
+    """
+    chunks = []
+    while True:
+        try:
+            chunks.append(await stream.readuntil(b"\n"))
+        except asyncio.IncompleteReadError as exc:
+            chunks.append(exc.partial)  # EOF: last line without a newline
+        except asyncio.LimitOverrunError as exc:
+            chunks.append(await stream.readexactly(exc.consumed))
+            continue
+        return b"".join(chunks)
 
 
 class CodexCLIOrchestrator:
-    def __init__(self, workspace: str = "aurora_pro"):
+    OUTPUT_TAIL_BYTES = 64 * 1024  # per stream, kept for the result dict
+    LINE_LIMIT = 1024 * 1024  # longest single line the stream reader accepts
+    COORDINATION_LOG_PATH = "/home/v/Desktop/codex_setup_log.txt"
+
+    def __init__(self, workspace: str = "aurora_pro", worker_cmd: Optional[List[str]] = None):
         self.workspace = Path(workspace).resolve()
         self.config_path = self.workspace / ".codex" / "config.json"
         self.model = "gpt-5-codex"
+        self._appender = AsyncAppender()
+        self._workspace_ready = False
+
+        # Optional long-lived worker speaking line-delimited JSON on stdin/stdout:
+        # request {"id", "prompt", "model", "reasoning", "approval"},
+        # response {"id", "exit_code", "stdout", "stderr"}.
+        self.worker_cmd = worker_cmd
+        self._worker: Optional[asyncio.subprocess.Process] = None
+        self._worker_reader: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._request_ids = itertools.count(1)
+
+    async def start(self) -> None:
+        """Prepare the workspace and, if configured, launch the persistent worker."""
+        self.ensure_workspace()
+        if not self.worker_cmd or self._worker is not None:
+            return
+        try:
+            self._worker = await asyncio.create_subprocess_exec(
+                *self.worker_cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                cwd=str(self.workspace),
+                limit=self.LINE_LIMIT,
+            )
+        except OSError as exc:
+            print(f"[CODEX] Worker unavailable, spawning per task: {exc}")
+            return
+        self._worker_reader = asyncio.create_task(self._read_worker(self._worker))
+
+    async def close(self) -> None:
+        """Stop the worker, if any, and flush pending coordination log writes."""
+        worker, self._worker = self._worker, None
+        if worker is not None and worker.returncode is None:
+            worker.stdin.close()
+            try:
+                await asyncio.wait_for(worker.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                with contextlib.suppress(ProcessLookupError):
+                    worker.kill()
+                await worker.wait()
+        reader, self._worker_reader = self._worker_reader, None
+        if reader is not None:
+            # A reader that died on bad output must not abort shutdown
+            (error,) = await asyncio.gather(reader, return_exceptions=True)
+            if isinstance(error, Exception):
+                print(f"[CODEX] Worker reader failed: {error}")
+        await self._appender.close()
+
+    def _worker_ready(self) -> bool:
+        """True while the worker process and its response reader are both alive."""
+        return (
+            self._worker is not None
+            and self._worker.returncode is None
+            and self._worker_reader is not None
+            and not self._worker_reader.done()
+        )
 
     def ensure_workspace(self) -> None:
         self.workspace.mkdir(parents=True, exist_ok=True)
@@ -30,16 +113,27 @@ class CodexCLIOrchestrator:
                     indent=2,
                 )
             )
+        self._workspace_ready = True
 
     async def execute_command(
         self,
         prompt: str,
         reasoning: str = "high",
         approval: str = "auto",
+        on_line: Optional[Callable[[str, str], None]] = None,
     ) -> Dict:
-        """Execute Codex CLI with streaming output. Returns result dict."""
+        """Execute Codex CLI with streaming output. Returns result dict.
+
+        Output is read line by line as it arrives; ``on_line(stream, line)``
+        sees every line, while the result keeps only the last
+        ``OUTPUT_TAIL_BYTES`` of each stream.
+        """
+
+        if not self._workspace_ready:
+            self.ensure_workspace()
+        if self._worker_ready():
+            return await self._send_request(self._worker, prompt, reasoning, approval, on_line)
 
-        self.ensure_workspace()
         # Prefer `codex exec` when available; fall back to `codex` direct
         cmd = [
             "codex",
@@ -58,31 +152,139 @@ class CodexCLIOrchestrator:
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             cwd=str(self.workspace),
+            limit=self.LINE_LIMIT,
         )
 
-        stdout, stderr = await process.communicate()
+        try:
+            stdout, stderr = await asyncio.gather(
+                self._read_stream(process.stdout, "stdout", on_line),
+                self._read_stream(process.stderr, "stderr", on_line),
+            )
+            await process.wait()
+        finally:
+            # Reader failed or we were cancelled: never leave the process behind
+            if process.returncode is None:
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
 
         return {
             "exit_code": process.returncode,
-            "stdout": stdout.decode(),
-            "stderr": stderr.decode(),
+            "stdout": stdout,
+            "stderr": stderr,
+            "timestamp": datetime.utcnow().isoformat(),
+        }
+
+    async def _send_request(
+        self,
+        worker: asyncio.subprocess.Process,
+        prompt: str,
+        reasoning: str,
+        approval: str,
+        on_line: Optional[Callable[[str, str], None]],
+    ) -> Dict:
+        """Run one task on the persistent worker and wait for its response line."""
+        request_id = str(next(self._request_ids))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        request = {
+            "id": request_id,
+            "prompt": prompt,
+            "model": self.model,
+            "reasoning": reasoning,
+            "approval": approval,
+        }
+        try:
+            worker.stdin.write(json.dumps(request).encode() + b"\n")
+            await worker.stdin.drain()
+            response = await future
+        finally:
+            self._pending.pop(request_id, None)
+
+        if on_line is not None:
+            for stream in ("stdout", "stderr"):
+                for line in response.get(stream, "").splitlines():
+                    on_line(stream, line)
+        return {
+            "exit_code": response.get("exit_code"),
+            "stdout": response.get("stdout", "")[-self.OUTPUT_TAIL_BYTES:],
+            "stderr": response.get("stderr", "")[-self.OUTPUT_TAIL_BYTES:],
             "timestamp": datetime.utcnow().isoformat(),
         }
 
-    async def infrastructure_deployment(self, tasks: List[str]) -> Dict:
-        """Execute a series of Codex CLI tasks, logging each result."""
-        results: List[Dict] = []
-        for task in tasks:
-            print(f"[CODEX] Executing: {task.strip().splitlines()[0][:80]}")
-            result = await self.execute_command(task, reasoning="high")
-            results.append(result)
-            self._log_to_coordination(task, result)
-        return {"tasks_completed": len(results), "results": results}
-
-    def _log_to_coordination(self, task: str, result: Dict) -> None:
+    async def _read_worker(self, worker: asyncio.subprocess.Process) -> None:
+        """Route worker response lines to their waiting requests."""
+        try:
+            # Responses carry full stdout/stderr, so lines may exceed LINE_LIMIT
+            while line := await _readline(worker.stdout):
+                try:
+                    response = json.loads(line)
+                except ValueError:
+                    response = None
+                if not isinstance(response, dict):
+                    print(f"[CODEX] Ignoring malformed worker output: {line[:200]!r}")
+                    continue
+                future = self._pending.get(str(response.get("id")))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            # Worker gone: fail in-flight requests; later tasks spawn per call
+            # (close() still holds self._worker and reaps the process)
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("Codex worker exited"))
+
+    async def _read_stream(
+        self,
+        stream: asyncio.StreamReader,
+        name: str,
+        on_line: Optional[Callable[[str, str], None]],
+    ) -> str:
+        """Drain ``stream`` line by line, returning its bounded tail."""
+        tail = bytearray()
+        while line := await _readline(stream):
+            if on_line is not None:
+                on_line(name, line.decode(errors="replace").rstrip("\n"))
+            tail += line
+            if len(tail) > 2 * self.OUTPUT_TAIL_BYTES:
+                del tail[: -self.OUTPUT_TAIL_BYTES]
+        return bytes(tail[-self.OUTPUT_TAIL_BYTES:]).decode(errors="replace")
+
+    async def infrastructure_deployment(
+        self,
+        tasks: List[str],
+        concurrency: int = 3,
+        deps: Optional[List[List[int]]] = None,
+    ) -> Dict:
+        """Execute Codex CLI tasks, up to ``concurrency`` at a time, logging each result.
+
+        ``deps[i]`` lists the indices of tasks that must finish before task
+        ``i`` starts; without ``deps`` every task is independent. Results
+        are returned in task order.
+        """
+        deps = deps or [[] for _ in tasks]
+        if len(deps) != len(tasks):
+            raise ValueError("deps must have one entry per task")
+        sem = asyncio.Semaphore(concurrency)
+        finished = [asyncio.Event() for _ in tasks]
+
+        async def run(index: int, task: str) -> Dict:
+            try:
+                for dep in deps[index]:
+                    await finished[dep].wait()
+                async with sem:
+                    print(f"[CODEX] Executing: {task.strip().splitlines()[0][:80]}")
+                    result = await self.execute_command(task, reasoning="high")
+                await self._log_to_coordination(task, result)
+                return result
+            finally:
+                finished[index].set()
+
+        results = await asyncio.gather(*(run(i, task) for i, task in enumerate(tasks)))
+        return {"tasks_completed": len(results), "results": list(results)}
+
+    async def _log_to_coordination(self, task: str, result: Dict) -> None:
         """Append progress to shared Claude coordination log."""
-        log_path = Path("/home/v/Desktop/codex_setup_log.txt")
-        log_path.parent.mkdir(parents=True, exist_ok=True)
         ts = datetime.utcnow().isoformat()
         lines = [
             f"{ts} | CODEX TASK: {task.strip().splitlines()[0]}",
@@ -91,6 +293,6 @@ class CodexCLIOrchestrator:
         ]
         if result.get("stderr") and result["exit_code"] != 0:
             lines.append(f"Error: {result['stderr']}")
-        with log_path.open("a", encoding="utf-8") as fh:
-            fh.write("\n" + "\n".join(lines) + "\n")
+        entry = "\n" + "\n".join(lines) + "\n"
+        await self._appender.put(self.COORDINATION_LOG_PATH, entry.encode("utf-8"))
 
@@ -7,10 +7,10 @@ asynchronous communication between all agents in the Aurora Pro system.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Any, Callable, Coroutine, Dict
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
 
+import orjson
 import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
@@ -18,50 +18,154 @@ logger = logging.getLogger(__name__)
 class CommunicationBus:
     """A Redis-based pub/sub message bus for inter-agent communication."""
 
+    RECONNECT_BACKOFF_MAX = 30.0  # seconds
+    PUBLISH_FLUSH_INTERVAL = 0.001  # seconds publish() calls are left to coalesce
+    PUBLISH_BATCH_MAX = 256  # messages per pipeline
+    MAX_CONNECTIONS = 32
+    HEALTH_CHECK_INTERVAL = 30  # seconds idle before a connection is pinged on reuse
+
     def __init__(self, host: str = 'localhost', port: int = 6379):
-        self._redis = redis.Redis(host=host, port=port, decode_responses=True)
+        # Payloads stay bytes end to end; orjson reads and writes them directly.
+        # Publishes draw from the pool while the subscription holds its own
+        # dedicated connection, so bursts never queue behind the listener.
+        self._pool = redis.ConnectionPool(
+            host=host,
+            port=port,
+            max_connections=self.MAX_CONNECTIONS,
+            decode_responses=False,
+            health_check_interval=self.HEALTH_CHECK_INTERVAL,
+        )
+        self._redis = redis.Redis(connection_pool=self._pool)
         self._pubsub = self._redis.pubsub()
-        self._listeners: Dict[str, Callable[[Dict[str, Any]], Coroutine[Any, Any, None]]] = {}
+        # Keyed by the raw channel bytes pub/sub messages carry, so dispatch needs no decode
+        self._listeners: Dict[bytes, Callable[[Dict[str, Any]], Coroutine[Any, Any, None]]] = {}
+        # listen() returns immediately while nothing is subscribed
+        self._subscribed = asyncio.Event()
+        self._listener: Optional[asyncio.Task] = None
+        self._callback_tasks: Set[asyncio.Task] = set()
+        self._publish_queue: asyncio.Queue = asyncio.Queue()
+        self._publisher: Optional[asyncio.Task] = None
 
     async def connect(self):
         """Connect to the Redis server and start the listener task."""
         try:
             await self._redis.ping()
             logger.info("Successfully connected to Redis for communication bus.")
-            asyncio.create_task(self._listener_task())
+            if self._listener is None or self._listener.done():
+                self._listener = asyncio.create_task(self._listener_task())
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
 
     async def publish(self, channel: str, message: Dict[str, Any]):
-        """Publish a message to a specific channel."""
+        """Publish a message to a specific channel.
+
+        The message is queued and sent with any others published in the same
+        ``PUBLISH_FLUSH_INTERVAL`` as one pipelined round-trip.
+        """
+        self._publish_queue.put_nowait((channel, message))
+        if self._publisher is None or self._publisher.done():
+            self._publisher = asyncio.create_task(self._publisher_task())
+
+    async def publish_many(self, items: List[Tuple[str, Dict[str, Any]]]):
+        """Publish several ``(channel, message)`` pairs in a single pipeline."""
+        if not items:
+            return
         try:
-            await self._redis.publish(channel, json.dumps(message))
+            pipe = self._redis.pipeline(transaction=False)
+            for channel, message in items:
+                pipe.publish(channel, orjson.dumps(message))
+            await pipe.execute()
         except Exception as e:
-            logger.error(f"Failed to publish message to channel '{channel}': {e}")
+            channels = sorted({channel for channel, _ in items})
+            logger.error(f"Failed to publish {len(items)} message(s) to {channels}: {e}")
+
+    async def close(self):
+        """Flush queued publishes and stop the background tasks."""
+        if self._publisher is not None and not self._publisher.done():
+            self._publish_queue.put_nowait(None)
+            await self._publisher
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self._pubsub.aclose()
+        await self._redis.aclose()
+        await self._pool.disconnect()
 
     async def subscribe(self, channel: str, callback: Callable[[Dict[str, Any]], Coroutine[Any, Any, None]]):
         """Subscribe to a channel and register a callback."""
         await self._pubsub.subscribe(channel)
-        self._listeners[channel] = callback
+        self._listeners[channel.encode()] = callback
+        self._subscribed.set()
         logger.info(f"Subscribed to channel: {channel}")
 
     async def _listener_task(self):
-        """The main listener task that receives messages and calls callbacks."""
+        """The main listener task that receives messages and calls callbacks.
+
+        Blocks on the pub/sub socket instead of polling; callbacks run as
+        separate tasks so a slow handler does not stall the reader.
+        """
+        backoff = 0.5
         while True:
             try:
-                message = await self._pubsub.get_message(ignore_subscribe_messages=True)
-                if message:
-                    channel = message['channel']
-                    if channel in self._listeners:
-                        try:
-                            data = json.loads(message['data'])
-                            await self._listeners[channel](data)
-                        except json.JSONDecodeError:
-                            logger.warning(f"Received non-JSON message on channel '{channel}': {message['data']}")
-                await asyncio.sleep(0.01)
+                await self._subscribed.wait()
+                async for message in self._pubsub.listen():
+                    backoff = 0.5
+                    if message['type'] != 'message':
+                        continue
+                    # Look up the subscriber before doing any decoding work
+                    callback = self._listeners.get(message['channel'])
+                    if callback is None:
+                        continue
+                    channel = message['channel'].decode()
+                    try:
+                        data = orjson.loads(message['data'])
+                    except orjson.JSONDecodeError:
+                        logger.warning(f"Received non-JSON message on channel '{channel}': {message['data']}")
+                        continue
+                    task = asyncio.create_task(self._run_callback(channel, callback, data))
+                    self._callback_tasks.add(task)
+                    task.add_done_callback(self._callback_tasks.discard)
+                # listen() ends once every channel is unsubscribed
+                self._subscribed.clear()
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error(f"Error in communication bus listener: {e}")
+                logger.error(f"Error in communication bus listener: {e}; retrying in {backoff:.1f}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.RECONNECT_BACKOFF_MAX)
+
+    async def _publisher_task(self):
+        """Coalesce queued publish() calls into pipelined batches."""
+        queue = self._publish_queue
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            await asyncio.sleep(self.PUBLISH_FLUSH_INTERVAL)
+
+            batch = [item]
+            done = False
+            while len(batch) < self.PUBLISH_BATCH_MAX and not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+
+            await self.publish_many(batch)
+            if done:
+                return
+
+    async def _run_callback(self, channel: str, callback, data: Dict[str, Any]) -> None:
+        try:
+            await callback(data)
+        except Exception as e:
+            logger.error(f"Callback for channel '{channel}' failed: {e}")
 
 # Singleton instance
 _communication_bus_instance: CommunicationBus | None = None
@@ -14,19 +14,20 @@ Features:
 - Decision tree visualization
 """
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import psutil
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 
-import aiofiles
+import numpy as np
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
@@ -38,10 +39,37 @@ from multicore_manager import get_multicore_manager
 from cache_manager import get_cache_manager
 from vision_agent import get_vision_agent
 from stealth_browser_agent import get_stealth_browser
+from async_appender import AsyncAppender
+
+try:  # optional: in-process NVML bindings, no nvidia-smi subprocess
+    import pynvml
+except ImportError:  # pragma: no cover - optional dependency
+    pynvml = None
 
 logger = logging.getLogger(__name__)
 
 
+def _json_patch(old: Dict[str, Any], new: Dict[str, Any], path: str = "") -> List[Dict[str, Any]]:
+    """RFC 6902 operations turning ``old`` into ``new``; nested dicts are diffed, other values replaced."""
+    ops: List[Dict[str, Any]] = []
+    for key, value in new.items():
+        key_path = f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+        if key not in old:
+            ops.append({"op": "add", "path": key_path, "value": value})
+            continue
+        previous = old[key]
+        if previous == value:
+            continue
+        if isinstance(previous, dict) and isinstance(value, dict):
+            ops.extend(_json_patch(previous, value, key_path))
+        else:
+            ops.append({"op": "replace", "path": key_path, "value": value})
+    for key in old.keys() - new.keys():
+        key_path = f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+        ops.append({"op": "remove", "path": key_path})
+    return ops
+
+
 class SystemStatus(Enum):
     """Overall system status."""
     HEALTHY = "healthy"
@@ -50,7 +78,7 @@ class SystemStatus(Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """Real-time system metrics."""
     timestamp: str
@@ -68,7 +96,62 @@ class SystemMetrics:
     gpu_memory_total_gb: Optional[float] = None
 
 
-@dataclass
+class MetricsHistory:
+    """Fixed-size ring of metric samples, stored as one NumPy array per field.
+
+    Bounded percentages are kept as uint16 hundredths (0-10000), with
+    ``MISSING`` marking an unavailable reading. Process CPU can exceed 100%
+    on multi-core hosts, so it stays float32 alongside the GB figures.
+    Timestamps are whole seconds since the first sample.
+    """
+
+    PERCENT_FIELDS = ("memory_percent", "disk_percent", "gpu_utilization")
+    FLOAT_FIELDS = ("cpu_percent", "memory_used_gb")
+    MISSING = np.iinfo(np.uint16).max
+
+    def __init__(self, size: int):
+        self._size = size
+        self._head = 0  # next slot to write
+        self._count = 0
+        self._start_ts: Optional[float] = None
+        self._offsets = np.zeros(size, dtype=np.uint32)
+        self._percents = {name: np.zeros(size, dtype=np.uint16) for name in self.PERCENT_FIELDS}
+        self._floats = {name: np.zeros(size, dtype=np.float32) for name in self.FLOAT_FIELDS}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, metrics: SystemMetrics) -> None:
+        if self._start_ts is None:
+            self._start_ts = timestamp
+        i = self._head
+        self._offsets[i] = max(0, round(timestamp - self._start_ts))
+        for name, column in self._percents.items():
+            value = getattr(metrics, name)
+            column[i] = self.MISSING if value is None else min(max(round(value * 100), 0), self.MISSING - 1)
+        for name, column in self._floats.items():
+            column[i] = getattr(metrics, name)
+        self._head = (i + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def tail(self, limit: int) -> Dict[str, list]:
+        """Return the newest ``limit`` samples, oldest first, as per-field lists."""
+        n = max(0, min(limit, self._count))
+        index = (self._head - n + np.arange(n)) % self._size
+        # Widen before rounding so float32 noise does not leak into the JSON output
+        result = {name: column[index].astype(np.float64).round(3).tolist() for name, column in self._floats.items()}
+        for name, column in self._percents.items():
+            raw = column[index]
+            values = (raw / 100.0).tolist()
+            missing = raw == self.MISSING
+            if missing.any():
+                values = [None if m else v for v, m in zip(values, missing.tolist())]
+            result[name] = values
+        result["timestamp"] = (self._offsets[index] + (self._start_ts or 0.0)).tolist()
+        return result
+
+
+@dataclass(slots=True)
 class AgentStatus:
     """Status of a single agent."""
     name: str
@@ -92,6 +175,14 @@ class ControlCenter:
 
     LOG_PATH = "/root/aurora_pro/logs/control_center.log"
     METRICS_HISTORY_SIZE = 300  # Keep 5 minutes at 1s intervals
+    GPU_SAMPLE_INTERVAL = 1.0  # seconds between GPU samples
+    DISK_SAMPLE_INTERVAL = 10.0  # seconds between disk_usage() samples
+    AGENT_STOP_TIMEOUT = 2.0  # seconds each agent gets to stop during an emergency stop
+    CLIENT_SEND_TIMEOUT = 1.0  # seconds before a slow client is dropped
+    STATUS_CACHE_TTL = 0.5  # seconds a collected status is reused by get_full_status()
+    HEARTBEAT_INTERVAL = 2.0  # seconds between broadcasts when nothing is marked dirty
+    MIN_BROADCAST_INTERVAL = 0.1  # seconds; caps the broadcast rate under bursts of changes
+    METRIC_CHANGE_THRESHOLD = 5.0  # percentage points of CPU/memory movement that trigger a push
 
     def __init__(self):
         self._running = False
@@ -99,10 +190,12 @@ class ControlCenter:
         self._lock = asyncio.Lock()
 
         # WebSocket connections
-        self._ws_clients: Set[WebSocket] = set()
+        # Copy-on-write: replaced, never mutated, so broadcasts can iterate a snapshot
+        self._ws_clients: List[WebSocket] = []
 
         # Metrics history
-        self._metrics_history: Deque[SystemMetrics] = deque(maxlen=self.METRICS_HISTORY_SIZE)
+        self._metrics_history = MetricsHistory(self.METRICS_HISTORY_SIZE)
+        self._latest_metrics: Optional[SystemMetrics] = None
 
         # Agent references
         self._llm = get_llm_orchestrator()
@@ -117,21 +210,59 @@ class ControlCenter:
         self._monitor_task: Optional[asyncio.Task] = None
         self._broadcast_task: Optional[asyncio.Task] = None
 
+        # Agents halted by emergency_stop; start() adds the rest
+        self._stoppable: List[Any] = []
+        self.register_stoppable(self._autonomous)
+        self.register_stoppable(self._llm)
+
+        # Last status sent to clients; status_patch messages are diffs against it
+        self._latest_status: Optional[Dict[str, Any]] = None
+
+        # Most recent collection, shared by the broadcast loop and HTTP endpoints
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_cache_at = 0.0
+        self._status_inflight: Optional[asyncio.Future] = None
+
+        # Set when a status change should reach clients before the next heartbeat
+        self._status_dirty = asyncio.Event()
+        self._notified_metrics: Optional[SystemMetrics] = None
+
         # Process info
         self._process = psutil.Process()
+        self._appender = AsyncAppender()
         self._net_io_start = psutil.net_io_counters()
+        self._disk_cache = None
+        self._disk_cache_ts = 0.0
+        self._nvml_handle = None
+        self._gpu_available = True
+        self._gpu_cache = (None, None, None)
+        self._gpu_cache_ts = 0.0
 
     async def start(self):
         """Initialize control center."""
         self._running = True
         self._emergency_stop_triggered = False
 
+        # Prime the non-blocking CPU sampler; later calls report the delta since the last one
+        self._process.cpu_percent(interval=None)
+
+        if pynvml is not None and self._nvml_handle is None:
+            try:
+                pynvml.nvmlInit()
+                self._nvml_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+            except pynvml.NVMLError as e:
+                logger.debug(f"NVML unavailable, falling back to GPUtil: {e}")
+
         # Get agent references
         self._multicore = get_multicore_manager()
         self._cache = get_cache_manager()
         self._vision = get_vision_agent()
         self._browser = get_stealth_browser()
 
+        # Agents halted by emergency_stop
+        for agent in (self._autonomous, self._multicore, self._browser, self._vision, self._cache, self._llm):
+            self.register_stoppable(agent)
+
         # Start background tasks
         self._monitor_task = asyncio.create_task(self._monitor_loop())
         self._broadcast_task = asyncio.create_task(self._broadcast_loop())
@@ -149,14 +280,22 @@ class ControlCenter:
         if self._broadcast_task:
             self._broadcast_task.cancel()
 
+        if self._nvml_handle is not None:
+            self._nvml_handle = None
+            try:
+                pynvml.nvmlShutdown()
+            except pynvml.NVMLError:
+                pass
+
         # Disconnect all WebSocket clients
-        for client in list(self._ws_clients):
+        for client in self._ws_clients:
             try:
                 await client.close()
             except:
                 pass
 
         await self._audit_log("system", "Control Center stopped")
+        await self._appender.close()
 
     async def emergency_stop(self, reason: str = "Manual trigger"):
         """
@@ -173,38 +312,31 @@ class ControlCenter:
         await self._audit_log("EMERGENCY_STOP", f"Reason: {reason}")
         logger.critical(f"EMERGENCY STOP TRIGGERED: {reason}")
 
-        # Broadcast emergency stop to all clients
-        await self._broadcast_to_clients({
-            "type": "emergency_stop",
-            "reason": reason,
-            "timestamp": datetime.utcnow().isoformat(),
-        })
-
-        # Stop all agents in parallel
-        stop_tasks = []
-
-        if self._autonomous and self._autonomous._running:
-            stop_tasks.append(self._autonomous.stop())
-
-        if self._multicore and self._multicore._running:
-            stop_tasks.append(self._multicore.stop())
-
-        if self._browser and self._browser._running:
-            stop_tasks.append(self._browser.stop())
-
-        if self._vision and self._vision._running:
-            stop_tasks.append(self._vision.stop())
-
-        if self._cache and self._cache._running:
-            stop_tasks.append(self._cache.stop())
+        # Stop all running agents in parallel, notifying clients alongside
+        await asyncio.gather(
+            *(self._stop_agent(agent) for agent in self._stoppable if agent._running),
+            self._broadcast_to_clients({
+                "type": "emergency_stop",
+                "reason": reason,
+                "timestamp": datetime.utcnow().isoformat(),
+            }),
+            return_exceptions=True,
+        )
 
-        if self._llm and self._llm._running:
-            stop_tasks.append(self._llm.stop())
+        logger.critical("All agents stopped - Emergency stop complete")
+        self.mark_status_dirty()
 
-        # Execute all stops
-        await asyncio.gather(*stop_tasks, return_exceptions=True)
+    def register_stoppable(self, agent: Any) -> None:
+        """Include ``agent`` (anything with ``_running`` and async ``stop()``) in emergency stops."""
+        if agent is not None and agent not in self._stoppable:
+            self._stoppable.append(agent)
 
-        logger.critical("All agents stopped - Emergency stop complete")
+    async def _stop_agent(self, agent: Any) -> None:
+        """Stop one agent, giving up after AGENT_STOP_TIMEOUT so a hung stop cannot block the rest."""
+        try:
+            await asyncio.wait_for(agent.stop(), timeout=self.AGENT_STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.critical(f"{type(agent).__name__} did not stop within {self.AGENT_STOP_TIMEOUT}s")
 
     async def restart_system(self):
         """Restart all system components."""
@@ -234,6 +366,7 @@ class ControlCenter:
             await self._browser.start()
 
         await self._audit_log("system", "System restart complete")
+        self.mark_status_dirty()
 
     async def _monitor_loop(self):
         """Background loop to collect system metrics."""
@@ -242,7 +375,12 @@ class ControlCenter:
                 metrics = await self._collect_metrics()
 
                 async with self._lock:
-                    self._metrics_history.append(metrics)
+                    self._metrics_history.append(time.time(), metrics)
+                    self._latest_metrics = metrics
+
+                if self._metrics_changed(metrics):
+                    self._notified_metrics = metrics
+                    self.mark_status_dirty()
 
                 await asyncio.sleep(1.0)  # Collect every second
 
@@ -256,17 +394,30 @@ class ControlCenter:
         """Background loop to broadcast updates to WebSocket clients."""
         while self._running:
             try:
-                # Collect comprehensive status
-                status = await self._collect_full_status()
+                # Wake on a status change, or on the heartbeat if nothing changed
+                try:
+                    await asyncio.wait_for(self._status_dirty.wait(), timeout=self.HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                self._status_dirty.clear()
+                if not self._ws_clients:
+                    continue
+
+                # Collect comprehensive status and diff it against what clients hold
+                status = await self.get_full_status(max_age=0.0)
+                previous, self._latest_status = self._latest_status, status
+                timestamp = datetime.utcnow().isoformat()
+                if previous is None:
+                    message = {"type": "status_update", "data": status, "timestamp": timestamp}
+                elif status == previous:
+                    message = {"type": "heartbeat", "timestamp": timestamp}
+                else:
+                    message = {"type": "status_patch", "ops": _json_patch(previous, status), "timestamp": timestamp}
 
                 # Broadcast to all connected clients
-                await self._broadcast_to_clients({
-                    "type": "status_update",
-                    "data": status,
-                    "timestamp": datetime.utcnow().isoformat(),
-                })
+                await self._broadcast_to_clients(message)
 
-                await asyncio.sleep(0.5)  # Broadcast twice per second
+                await asyncio.sleep(self.MIN_BROADCAST_INTERVAL)
 
             except asyncio.CancelledError:
                 break
@@ -274,18 +425,37 @@ class ControlCenter:
                 logger.error(f"Broadcast loop error: {e}")
                 await asyncio.sleep(2.0)
 
+    def mark_status_dirty(self) -> None:
+        """Ask the broadcast loop to push a status update before the next heartbeat."""
+        self._status_dirty.set()
+
+    def _metrics_changed(self, metrics: SystemMetrics) -> bool:
+        """Whether CPU or memory moved enough since the last pushed sample."""
+        last = self._notified_metrics
+        if last is None:
+            return True
+        return (
+            abs(metrics.cpu_percent - last.cpu_percent) >= self.METRIC_CHANGE_THRESHOLD
+            or abs(metrics.memory_percent - last.memory_percent) >= self.METRIC_CHANGE_THRESHOLD
+        )
+
     async def _collect_metrics(self) -> SystemMetrics:
         """Collect current system metrics."""
-        # CPU and Memory
-        cpu_percent = self._process.cpu_percent(interval=0.1)
-        mem_info = self._process.memory_info()
-        mem_percent = self._process.memory_percent()
+        # CPU and Memory (interval=None never sleeps on the event loop)
+        with self._process.oneshot():
+            cpu_percent = self._process.cpu_percent(interval=None)
+            mem_info = self._process.memory_info()
+            mem_percent = self._process.memory_percent()
 
         # System memory
         sys_mem = psutil.virtual_memory()
 
-        # Disk
-        disk = psutil.disk_usage('/')
+        # Disk (changes slowly, so resample only every DISK_SAMPLE_INTERVAL)
+        now = time.monotonic()
+        if self._disk_cache is None or now - self._disk_cache_ts > self.DISK_SAMPLE_INTERVAL:
+            self._disk_cache = psutil.disk_usage('/')
+            self._disk_cache_ts = now
+        disk = self._disk_cache
 
         # Network
         net_io = psutil.net_io_counters()
@@ -293,20 +463,14 @@ class ControlCenter:
         net_recv_mb = (net_io.bytes_recv - self._net_io_start.bytes_recv) / (1024 * 1024)
 
         # GPU (if available)
-        gpu_util = None
-        gpu_mem_used = None
-        gpu_mem_total = None
-
-        try:
-            import GPUtil
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                gpu = gpus[0]
-                gpu_util = gpu.load * 100
-                gpu_mem_used = gpu.memoryUsed / 1024  # Convert to GB
-                gpu_mem_total = gpu.memoryTotal / 1024
-        except:
-            pass
+        if self._gpu_available and now - self._gpu_cache_ts >= self.GPU_SAMPLE_INTERVAL:
+            if self._nvml_handle is not None:
+                self._gpu_cache = self._sample_gpu_nvml()
+            else:
+                # GPUtil shells out to nvidia-smi; keep it off the event loop
+                self._gpu_cache = await asyncio.to_thread(self._sample_gpu_gputil)
+            self._gpu_cache_ts = now
+        gpu_util, gpu_mem_used, gpu_mem_total = self._gpu_cache
 
         return SystemMetrics(
             timestamp=datetime.utcnow().isoformat(),
@@ -324,12 +488,58 @@ class ControlCenter:
             gpu_memory_total_gb=gpu_mem_total,
         )
 
+    def _sample_gpu_nvml(self):
+        """Read utilization and memory (GB) through NVML; microseconds, in-process."""
+        try:
+            util = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
+            mem = pynvml.nvmlDeviceGetMemoryInfo(self._nvml_handle)
+            return float(util.gpu), mem.used / (1024 ** 3), mem.total / (1024 ** 3)
+        except pynvml.NVMLError:
+            return None, None, None
+
+    def _sample_gpu_gputil(self):
+        """Read utilization and memory (GB) through GPUtil; blocking, run in a thread."""
+        try:
+            import GPUtil
+        except ImportError:
+            self._gpu_available = False
+            return None, None, None
+        try:
+            gpus = GPUtil.getGPUs()
+            if gpus:
+                gpu = gpus[0]
+                return gpu.load * 100, gpu.memoryUsed / 1024, gpu.memoryTotal / 1024  # MB -> GB
+        except Exception:
+            pass
+        return None, None, None
+
+    async def get_full_status(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """Return the system status, reusing one collected within ``max_age`` seconds.
+
+        Concurrent callers share a single in-flight collection.
+        """
+        if max_age is None:
+            max_age = self.STATUS_CACHE_TTL
+        if self._status_cache is not None and time.monotonic() - self._status_cache_at <= max_age:
+            return self._status_cache
+
+        task = self._status_inflight
+        if task is None:
+            task = self._status_inflight = asyncio.ensure_future(self._collect_full_status())
+            try:
+                status = await asyncio.shield(task)
+            finally:
+                if self._status_inflight is task:
+                    self._status_inflight = None
+            self._status_cache = status
+            self._status_cache_at = time.monotonic()
+            return status
+        return await asyncio.shield(task)
+
     async def _collect_full_status(self) -> Dict[str, Any]:
         """Collect comprehensive system status."""
         # Get latest metrics
-        latest_metrics = None
-        if self._metrics_history:
-            latest_metrics = self._metrics_history[-1]
+        latest_metrics = self._latest_metrics
 
         # Collect agent statuses
         agents = {}
@@ -511,68 +721,100 @@ class ControlCenter:
 
         return SystemStatus.HEALTHY
 
+    @staticmethod
+    def _encode(message: Dict[str, Any]) -> str:
+        """Serialize a WebSocket message; text frames keep existing JSON clients working."""
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+
     async def _broadcast_to_clients(self, message: Dict[str, Any]):
         """Broadcast message to all WebSocket clients."""
-        dead_clients = set()
+        clients = self._ws_clients
+        if not clients:
+            return
+        dead_clients = []
+
+        # Serialize once per broadcast, not once per client
+        payload = self._encode(message)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.send_text(payload), self.CLIENT_SEND_TIMEOUT) for client in clients),
+            return_exceptions=True,
+        )
 
-        for client in self._ws_clients:
-            try:
-                await client.send_json(message)
-            except WebSocketDisconnect:
-                dead_clients.add(client)
-            except Exception as e:
-                logger.warning(f"Error broadcasting to client: {e}")
-                dead_clients.add(client)
+        for client, result in zip(clients, results):
+            if isinstance(result, WebSocketDisconnect):
+                dead_clients.append(client)
+            elif isinstance(result, Exception):
+                logger.warning(f"Error broadcasting to client: {result!r}")
+                dead_clients.append(client)
+
+        # Remove dead clients, closing them so a timed-out (possibly half-sent)
+        # client reconnects and gets a fresh snapshot instead of going silent
+        if dead_clients:
+            dead_ids = {id(c) for c in dead_clients}
+            self._ws_clients = [c for c in self._ws_clients if id(c) not in dead_ids]
+            await asyncio.gather(*(self._close_client(c) for c in dead_clients))
 
-        # Remove dead clients
-        for client in dead_clients:
-            self._ws_clients.discard(client)
+    async def _close_client(self, client: WebSocket) -> None:
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(client.close(code=1011), self.CLIENT_SEND_TIMEOUT)
 
     async def add_websocket_client(self, websocket: WebSocket):
         """Add WebSocket client."""
         await websocket.accept()
-        self._ws_clients.add(websocket)
+
+        # The initial status must be the snapshot later patches are diffed
+        # against, so reuse it and ask for a prompt patch if it has aged.
+        status = self._latest_status
+        if status is None:
+            status = await self.get_full_status()
+            if self._latest_status is None:
+                self._latest_status = status
+            status = self._latest_status
+        self._ws_clients = [*self._ws_clients, websocket]
         logger.info(f"WebSocket client connected. Total: {len(self._ws_clients)}")
+        self.mark_status_dirty()
 
-        # Send initial status
-        status = await self._collect_full_status()
-        await websocket.send_json({
+        await websocket.send_text(self._encode({
             "type": "initial_status",
             "data": status,
-        })
+        }))
 
     async def remove_websocket_client(self, websocket: WebSocket):
         """Remove WebSocket client."""
-        self._ws_clients.discard(websocket)
+        self._ws_clients = [c for c in self._ws_clients if c is not websocket]
         logger.info(f"WebSocket client disconnected. Total: {len(self._ws_clients)}")
 
     async def _audit_log(self, action: str, details: str):
         """Write audit log entry."""
         try:
-            Path(self.LOG_PATH).parent.mkdir(parents=True, exist_ok=True)
             timestamp = datetime.utcnow().isoformat()
             log_entry = f"{timestamp} | {action} | {details}\n"
-
-            async with aiofiles.open(self.LOG_PATH, "a") as f:
-                await f.write(log_entry)
+            await self._appender.put(self.LOG_PATH, log_entry.encode())
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
 
     def get_metrics_history(self, minutes: int = 5) -> List[Dict[str, Any]]:
         """Get historical metrics."""
         limit = minutes * 60  # 1 per second
-        metrics = list(self._metrics_history)[-limit:]
+        columns = self._metrics_history.tail(limit)
 
         return [
             {
-                "timestamp": m.timestamp,
-                "cpu_percent": m.cpu_percent,
-                "memory_percent": m.memory_percent,
-                "memory_used_gb": m.memory_used_gb,
-                "disk_percent": m.disk_percent,
-                "gpu_utilization": m.gpu_utilization,
+                "timestamp": datetime.utcfromtimestamp(ts).isoformat(),
+                "cpu_percent": cpu,
+                "memory_percent": mem,
+                "memory_used_gb": mem_used,
+                "disk_percent": disk,
+                "gpu_utilization": gpu,
             }
-            for m in metrics
+            for ts, cpu, mem, mem_used, disk, gpu in zip(
+                columns["timestamp"],
+                columns["cpu_percent"],
+                columns["memory_percent"],
+                columns["memory_used_gb"],
+                columns["disk_percent"],
+                columns["gpu_utilization"],
+            )
         ]
 
     def get_status(self) -> Dict[str, Any]:
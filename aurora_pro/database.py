@@ -1,25 +1,135 @@
 """
 SQLite database with WAL mode for evidence storage.
 """
-import json
+import asyncio
+import hashlib
+import logging
 import time
 import uuid
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 
 import aiosqlite
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class _QueryCache:
+    """Bounded LRU of query results with a per-entry TTL.
+
+    Values must be immutable (row tuples, counts): every hit hands out the
+    same object, so callers build fresh dicts from it.
+
+    ``generation`` is bumped on every clear so a read that started before a
+    write cannot store its now-stale result.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: tuple) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def put(self, key: tuple, value: Any, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
 
 
 class Database:
     """Manages SQLite database for evidence storage."""
 
+    INSERT_BATCH_WINDOW = 0.01  # seconds single inserts wait to share a transaction
+    INSERT_BATCH_MAX = 500  # rows per transaction
+    CHECKPOINT_INTERVAL = 60  # seconds between WAL truncating checkpoints
+    QUERY_CACHE_SIZE = 512
+    QUERY_CACHE_TTL = 5.0  # seconds; writes also invalidate
+
+    # Applied in order on the shared connection
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",  # WAL stays consistent; fsync only at checkpoints
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",  # 256 MiB
+        "PRAGMA cache_size=-131072",  # 128 MiB
+        "PRAGMA busy_timeout=5000",
+        "PRAGMA wal_autocheckpoint=1000",
+    )
+
+    # Re-inserting identical content is a no-op; see _insert_rows for the returned ids
+    _INSERT_SQL = """
+        INSERT OR IGNORE INTO evidence (id, url, title, score, facets, created_at, hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # Column order _row_to_dict unpacks; rows come back as plain tuples
+    _COLUMN_NAMES = ("id", "url", "title", "score", "facets", "created_at")
+    _COLUMNS = ", ".join(_COLUMN_NAMES)
+    _JOINED_COLUMNS = ", ".join("e." + name for name in _COLUMN_NAMES)  # evidence aliased as e
+
+    # Fixed SQL text per query shape so sqlite3's per-connection statement
+    # cache reuses the prepared statement instead of recompiling
+    _GET_SQL = f"SELECT {_COLUMNS} FROM evidence WHERE id = ?"
+    _LIST_SQL = f"""
+        SELECT {_COLUMNS} FROM evidence
+        ORDER BY score DESC, created_at DESC LIMIT ? OFFSET ?
+    """
+    _LIST_MIN_SCORE_SQL = f"""
+        SELECT {_COLUMNS} FROM evidence WHERE score >= ?
+        ORDER BY score DESC, created_at DESC LIMIT ? OFFSET ?
+    """
+    _COUNT_SQL = "SELECT COUNT(*) FROM evidence"
+    _COUNT_MIN_SCORE_SQL = "SELECT COUNT(*) FROM evidence WHERE score >= ?"
+    _SEARCH_SQL = f"""
+        SELECT {_JOINED_COLUMNS} FROM evidence_fts
+        JOIN evidence e ON e.rowid = evidence_fts.rowid
+        WHERE evidence_fts MATCH ?
+        ORDER BY rank
+        LIMIT ?
+    """
+
     def __init__(self, db_path: str = "aurora.db"):
         self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._insert_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self._query_cache = _QueryCache(self.QUERY_CACHE_SIZE, self.QUERY_CACHE_TTL)
 
     async def initialize(self):
-        """Create database and enable WAL mode."""
-        async with aiosqlite.connect(self.db_path) as db:
-            # Enable WAL mode for better concurrency
-            await db.execute("PRAGMA journal_mode=WAL")
+        """Open the shared connection, enable WAL mode and create the schema."""
+        if self._conn is None:
+            # Autocommit mode; writes manage their own transactions
+            self._conn = await aiosqlite.connect(self.db_path, isolation_level=None)
+        db = self._conn
+
+        async with self._write_lock:
+            # WAL mode plus relaxed sync and larger caches for concurrency
+            for pragma in self.PRAGMAS:
+                await db.execute(pragma)
+            async with db.execute("PRAGMA journal_mode") as cursor:
+                row = await cursor.fetchone()
+            logger.info(f"SQLite {self.db_path} journal_mode={row[0]}")
 
             # Create evidence table
             await db.execute("""
@@ -28,11 +138,24 @@ class Database:
                     url TEXT NOT NULL,
                     title TEXT,
                     score REAL,
-                    facets TEXT,
-                    created_at REAL
+                    facets BLOB,
+                    created_at REAL,
+                    hash BLOB
                 )
             """)
 
+            async with db.execute("PRAGMA table_info(evidence)") as cursor:
+                columns = {row[1] for row in await cursor.fetchall()}
+            if "hash" not in columns:
+                # Pre-dedup databases; their rows keep a NULL hash
+                await db.execute("ALTER TABLE evidence ADD COLUMN hash BLOB")
+
+            # Content hash for deduplicating re-crawls
+            await db.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_evidence_hash
+                ON evidence(hash)
+            """)
+
             # Create index on score for sorting
             await db.execute("""
                 CREATE INDEX IF NOT EXISTS idx_evidence_score
@@ -45,7 +168,73 @@ class Database:
                 ON evidence(created_at DESC)
             """)
 
-            await db.commit()
+            await self._create_fts(db)
+
+        if self._writer_task is None:
+            self._insert_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._writer_loop(self._insert_queue))
+        if self._checkpoint_task is None:
+            self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+
+    async def _create_fts(self, db: aiosqlite.Connection) -> None:
+        """Create the FTS5 index over url/title, kept in sync with evidence by triggers."""
+        async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'evidence_fts'"
+        ) as cursor:
+            exists = await cursor.fetchone() is not None
+
+        await db.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS evidence_fts USING fts5(
+                url, title,
+                content='evidence', content_rowid='rowid',
+                tokenize='porter unicode61'
+            )
+        """)
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS evidence_fts_ai AFTER INSERT ON evidence BEGIN
+                INSERT INTO evidence_fts(rowid, url, title) VALUES (new.rowid, new.url, new.title);
+            END
+        """)
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS evidence_fts_ad AFTER DELETE ON evidence BEGIN
+                INSERT INTO evidence_fts(evidence_fts, rowid, url, title)
+                VALUES ('delete', old.rowid, old.url, old.title);
+            END
+        """)
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS evidence_fts_au AFTER UPDATE ON evidence BEGIN
+                INSERT INTO evidence_fts(evidence_fts, rowid, url, title)
+                VALUES ('delete', old.rowid, old.url, old.title);
+                INSERT INTO evidence_fts(rowid, url, title) VALUES (new.rowid, new.url, new.title);
+            END
+        """)
+        if not exists:
+            # Index rows written before the FTS table existed
+            await db.execute("INSERT INTO evidence_fts(evidence_fts) VALUES ('rebuild')")
+
+    async def close(self):
+        """Flush queued inserts and close the shared connection."""
+        if self._checkpoint_task is not None:
+            self._checkpoint_task.cancel()
+            try:
+                await self._checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            self._checkpoint_task = None
+        if self._writer_task is not None:
+            self._insert_queue.put_nowait(None)
+            await self._writer_task
+            self._writer_task = None
+            self._insert_queue = None
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+    @property
+    def _db(self) -> aiosqlite.Connection:
+        if self._conn is None:
+            raise RuntimeError("Database not initialized; call initialize() first")
+        return self._conn
 
     async def insert_evidence(
         self,
@@ -54,35 +243,120 @@ class Database:
         score: float,
         facets: Dict[str, Any]
     ) -> str:
-        """Insert new evidence record."""
-        evidence_id = str(uuid.uuid4())
-        created_at = time.time()
-        facets_json = json.dumps(facets)
-
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO evidence (id, url, title, score, facets, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (evidence_id, url, title, score, facets_json, created_at)
-            )
-            await db.commit()
+        """Insert new evidence record.
+
+        Concurrent calls are coalesced by a writer task into one transaction.
+        Identical content is stored once; the existing record's ID is returned.
+        """
+        if self._insert_queue is None:
+            raise RuntimeError("Database not initialized; call initialize() first")
+        row = self._evidence_row(url, title, score, facets)
+        future = asyncio.get_running_loop().create_future()
+        self._insert_queue.put_nowait((row, future))
+        return await future
+
+    async def insert_evidence_many(self, records: List[Dict[str, Any]]) -> List[str]:
+        """Insert several records (``url``, ``title``, ``score``, ``facets``) in one transaction."""
+        rows = [
+            self._evidence_row(r["url"], r.get("title"), r["score"], r.get("facets") or {})
+            for r in records
+        ]
+        ids: List[str] = []
+        for start in range(0, len(rows), self.INSERT_BATCH_MAX):
+            ids.extend(await self._insert_rows(rows[start:start + self.INSERT_BATCH_MAX]))
+        return ids
+
+    @staticmethod
+    def _evidence_row(
+        url: str,
+        title: Optional[str],
+        score: float,
+        facets: Dict[str, Any]
+    ) -> Tuple[str, str, Optional[str], float, bytes, float, bytes]:
+        # orjson bytes bind as a BLOB, skipping the str round-trip at the SQLite boundary
+        facets_blob = orjson.dumps(facets, option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.blake2b(
+            orjson.dumps([url, title, score]) + facets_blob, digest_size=16
+        ).digest()
+        return (str(uuid.uuid4()), url, title, score, facets_blob, time.time(), digest)
+
+    async def _insert_rows(self, rows: List[tuple]) -> List[str]:
+        """Write ``rows`` inside a single BEGIN IMMEDIATE ... COMMIT.
+
+        Returns the stored ID for each row, which is the earlier record's ID
+        when the content hash already existed.
+        """
+        hashes = [row[-1] for row in rows]
+        unique = list(dict.fromkeys(hashes))
+        async with self._write_lock:
+            db = self._db
+            await db.execute("BEGIN IMMEDIATE")
+            try:
+                await db.executemany(self._INSERT_SQL, rows)
+                async with db.execute(
+                    "SELECT hash, id FROM evidence WHERE hash IN (%s)" % ",".join("?" * len(unique)),
+                    unique,
+                ) as cursor:
+                    stored = {digest: evidence_id for digest, evidence_id in await cursor.fetchall()}
+            except BaseException:
+                await db.execute("ROLLBACK")
+                # Reads on the shared connection may have cached the rolled-back rows
+                self._query_cache.clear()
+                raise
+            await db.execute("COMMIT")
+            self._query_cache.clear()
+        return [stored[digest] for digest in hashes]
 
-        return evidence_id
+    async def _checkpoint_loop(self) -> None:
+        """Periodically fold the WAL back into the database and truncate it."""
+        while True:
+            await asyncio.sleep(self.CHECKPOINT_INTERVAL)
+            try:
+                async with self._write_lock:
+                    await self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except Exception as e:
+                logger.warning(f"WAL checkpoint failed: {e}")
+
+    async def _writer_loop(self, queue: asyncio.Queue) -> None:
+        """Drain queued single inserts in batches until a ``None`` sentinel."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            await asyncio.sleep(self.INSERT_BATCH_WINDOW)
+
+            batch = [item]
+            done = False
+            while len(batch) < self.INSERT_BATCH_MAX and not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+
+            try:
+                ids = await self._insert_rows([row for row, _ in batch])
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                for (_, future), evidence_id in zip(batch, ids):
+                    if not future.done():
+                        future.set_result(evidence_id)
+            if done:
+                return
 
     async def get_evidence(self, evidence_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve evidence by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM evidence WHERE id = ?",
-                (evidence_id,)
-            ) as cursor:
+        key = ("get", evidence_id)
+        hit, row = self._query_cache.get(key)
+        if not hit:
+            generation = self._query_cache.generation
+            async with self._db.execute(self._GET_SQL, (evidence_id,)) as cursor:
                 row = await cursor.fetchone()
-                if row:
-                    return self._row_to_dict(row)
-                return None
+            self._query_cache.put(key, row, generation)
+        return self._row_to_dict(row) if row else None
 
     async def list_evidence(
         self,
@@ -91,43 +365,66 @@ class Database:
         min_score: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """List evidence with optional filtering."""
-        query = "SELECT * FROM evidence"
-        params = []
+        key = ("list", limit, offset, min_score)
+        hit, rows = self._query_cache.get(key)
+        if not hit:
+            generation = self._query_cache.generation
+            if min_score is None:
+                query, params = self._LIST_SQL, (limit, offset)
+            else:
+                query, params = self._LIST_MIN_SCORE_SQL, (min_score, limit, offset)
 
-        if min_score is not None:
-            query += " WHERE score >= ?"
-            params.append(min_score)
-
-        query += " ORDER BY score DESC, created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(query, params) as cursor:
-                rows = await cursor.fetchall()
-                return [self._row_to_dict(row) for row in rows]
+            async with self._db.execute(query, params) as cursor:
+                rows = tuple(await cursor.fetchall())
+            self._query_cache.put(key, rows, generation)
+        return [self._row_to_dict(row) for row in rows]
 
     async def count_evidence(self, min_score: Optional[float] = None) -> int:
         """Count evidence records."""
-        query = "SELECT COUNT(*) as cnt FROM evidence"
-        params = []
+        key = ("count", min_score)
+        hit, cached = self._query_cache.get(key)
+        if hit:
+            return cached
+        generation = self._query_cache.generation
 
-        if min_score is not None:
-            query += " WHERE score >= ?"
-            params.append(min_score)
+        if min_score is None:
+            query, params = self._COUNT_SQL, ()
+        else:
+            query, params = self._COUNT_MIN_SCORE_SQL, (min_score,)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            async with db.execute(query, params) as cursor:
-                row = await cursor.fetchone()
-                return row[0] if row else 0
+        async with self._db.execute(query, params) as cursor:
+            row = await cursor.fetchone()
+        count = row[0] if row else 0
+        self._query_cache.put(key, count, generation)
+        return count
+
+    async def search_evidence(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Full-text search over url/title, best BM25 match first.
+
+        ``query`` uses FTS5 syntax; if it does not parse, its words are
+        searched as plain terms instead.
+        """
+        try:
+            async with self._db.execute(self._SEARCH_SQL, (query, limit)) as cursor:
+                rows = await cursor.fetchall()
+        except aiosqlite.OperationalError:
+            terms = " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+            if not terms:
+                return []
+            async with self._db.execute(self._SEARCH_SQL, (terms, limit)) as cursor:
+                rows = await cursor.fetchall()
+        return [self._row_to_dict(row) for row in rows]
 
-    def _row_to_dict(self, row: aiosqlite.Row) -> Dict[str, Any]:
-        """Convert row to dictionary."""
+    @staticmethod
+    def _row_to_dict(row: tuple) -> Dict[str, Any]:
+        """Convert a ``_COLUMNS`` row tuple to a dictionary."""
+        evidence_id, url, title, score, facets, created_at = row
         return {
-            "id": row["id"],
-            "url": row["url"],
-            "title": row["title"],
-            "score": row["score"],
-            "facets": json.loads(row["facets"]) if row["facets"] else {},
-            "created_at": row["created_at"]
+            "id": evidence_id,
+            "url": url,
+            "title": title,
+            "score": score,
+            # Older rows hold TEXT JSON; orjson.loads accepts both
+            "facets": orjson.loads(facets) if facets else {},
+            "created_at": created_at
         }
\ No newline at end of file
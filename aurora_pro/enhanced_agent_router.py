@@ -6,12 +6,21 @@ Implements intelligent routing with multi-factor decision making
 import asyncio
 import logging
 import time
+from collections import OrderedDict, deque
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import hashlib
 import json
+import re
+import threading
+
+import numpy as np
+
+try:
+    import ahocorasick_rs
+except ImportError:  # optional - a compiled regex scan is used instead
+    ahocorasick_rs = None
 
 
 class AgentType(Enum):
@@ -34,7 +43,7 @@ class TaskCategory(Enum):
     GENERAL = "general"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapability:
     agent_type: AgentType
     categories: List[TaskCategory]
@@ -45,7 +54,7 @@ class AgentCapability:
     availability: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class RoutingDecision:
     primary_agent: AgentType
     fallback_chain: List[AgentType]
@@ -53,9 +62,10 @@ class RoutingDecision:
     reasoning: str
     estimated_latency_ms: float
     estimated_cost: float
+    prompt_hash: bytes = b""  # blake2b-128 of the prompt, reusable as a dedupe key
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     agent_type: AgentType
     total_tasks: int = 0
@@ -63,22 +73,33 @@ class PerformanceMetrics:
     failed_tasks: int = 0
     total_latency_ms: float = 0.0
     average_latency_ms: float = 0.0
-    last_success_time: Optional[datetime] = None
-    last_failure_time: Optional[datetime] = None
-    error_count_5min: int = 0
+    last_success_time: Optional[float] = None  # time.monotonic()
+    last_failure_time: Optional[float] = None  # time.monotonic()
+    failure_times: deque = field(default_factory=deque)  # monotonic, oldest first
+
+    FAILURE_WINDOW = 300.0  # seconds
 
     def update_success(self, latency_ms: float):
         self.total_tasks += 1
         self.successful_tasks += 1
         self.total_latency_ms += latency_ms
         self.average_latency_ms = self.total_latency_ms / self.total_tasks
-        self.last_success_time = datetime.utcnow()
+        self.last_success_time = time.monotonic()
 
     def update_failure(self):
         self.total_tasks += 1
         self.failed_tasks += 1
-        self.last_failure_time = datetime.utcnow()
-        self.error_count_5min += 1
+        self.last_failure_time = now = time.monotonic()
+        self.failure_times.append(now)
+
+    @property
+    def error_count_5min(self) -> int:
+        """Failures within the last FAILURE_WINDOW seconds"""
+        cutoff = time.monotonic() - self.FAILURE_WINDOW
+        failure_times = self.failure_times
+        while failure_times and failure_times[0] < cutoff:
+            failure_times.popleft()
+        return len(failure_times)
 
     @property
     def success_rate(self) -> float:
@@ -106,9 +127,15 @@ class EnhancedAgentRouter:
     - Health monitoring
     """
 
+    ROUTE_CACHE_SIZE = 1024
+    ROUTE_CACHE_TTL = 30.0  # seconds
+
     def __init__(self):
         self.logger = logging.getLogger("aurora.enhanced_router")
 
+        # Decisions for repeated prompts, dropped whenever routing inputs change
+        self._route_cache: "OrderedDict[bytes, Tuple[float, RoutingDecision]]" = OrderedDict()
+
         # Agent capability registry
         self.capabilities: Dict[AgentType, AgentCapability] = self._init_capabilities()
 
@@ -118,8 +145,15 @@ class EnhancedAgentRouter:
             for agent_type in AgentType
         }
 
+        # Serializes metric/capability updates if route/record_result run in threads
+        self._update_lock = threading.Lock()
+
+        # Per-field arrays mirroring capabilities/metrics for _score_agents
+        self._build_score_arrays()
+
         # Keyword-to-category mapping
         self.keyword_map = self._init_keyword_map()
+        self._build_keyword_automaton()
 
         # Configuration
         self.confidence_threshold = 0.7
@@ -195,6 +229,43 @@ class EnhancedAgentRouter:
             )
         }
 
+    def _build_score_arrays(self):
+        """Lay capabilities and metrics out as one array per field for _score_agents.
+
+        The dataclasses stay the public view; _sync_agent_arrays copies a single
+        agent's row back in after record_result/enable_agent/disable_agent. Call
+        this again after editing capabilities directly.
+        """
+        self._agent_order = list(self.capabilities)
+        self._agent_index = {agent_type: i for i, agent_type in enumerate(self._agent_order)}
+        self._category_index = {cat: i for i, cat in enumerate(TaskCategory)}
+        self._category_matrix = np.zeros(
+            (len(self._agent_order), len(self._category_index)), dtype=np.float64
+        )
+        for row, agent_type in enumerate(self._agent_order):
+            for cat in self.capabilities[agent_type].categories:
+                self._category_matrix[row, self._category_index[cat]] = 1.0
+        self._confidence_vec = np.array(
+            [self.capabilities[a].confidence_multiplier for a in self._agent_order],
+            dtype=np.float64,
+        )
+        count = len(self._agent_order)
+        self._latency_vec = np.empty(count, dtype=np.float64)
+        self._cost_vec = np.empty(count, dtype=np.float64)
+        self._available = np.empty(count, dtype=bool)
+        self._success_rate_vec = np.empty(count, dtype=np.float64)
+        for agent_type in self._agent_order:
+            self._sync_agent_arrays(agent_type)
+        self._invalidate_route_cache()
+
+    def _sync_agent_arrays(self, agent_type: AgentType):
+        row = self._agent_index[agent_type]
+        capability = self.capabilities[agent_type]
+        self._latency_vec[row] = capability.average_latency_ms
+        self._cost_vec[row] = capability.cost_per_task
+        self._available[row] = capability.availability
+        self._success_rate_vec[row] = self.metrics[agent_type].success_rate
+
     def _init_keyword_map(self) -> Dict[str, List[TaskCategory]]:
         return {
             # Code-related
@@ -237,7 +308,30 @@ class EnhancedAgentRouter:
             "find": [TaskCategory.RESEARCH],
         }
 
-    async def route(
+    def _build_keyword_automaton(self):
+        """Compile keyword_map into one automaton; call again after editing the map"""
+        self._keyword_categories = list(self.keyword_map.values())
+        if ahocorasick_rs is not None:
+            self._keyword_ac = ahocorasick_rs.AhoCorasick(list(self.keyword_map))
+        else:
+            self._keyword_ac = None
+        # Zero-width lookahead so overlapping keywords ("research"/"search") all match;
+        # longest first in case one keyword is a prefix of another
+        keywords = sorted(self.keyword_map, key=len, reverse=True)
+        self._keyword_re = re.compile(
+            "(?=(" + "|".join(map(re.escape, keywords)) + "))"
+        )
+        self._invalidate_route_cache()
+
+    @staticmethod
+    def _copy_decision(decision: RoutingDecision) -> RoutingDecision:
+        """Caller-owned copy of a cached decision (fallback_chain is mutable)."""
+        return replace(decision, fallback_chain=list(decision.fallback_chain))
+
+    def _invalidate_route_cache(self):
+        self._route_cache.clear()
+
+    def route(
         self,
         prompt: str,
         context: Optional[Dict[str, Any]] = None,
@@ -256,13 +350,24 @@ class EnhancedAgentRouter:
         Returns:
             RoutingDecision with primary agent and fallbacks
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        prompt_hash = hashlib.blake2b(
+            prompt.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        cache_key = prompt_hash + bytes([prefer_fast, prefer_cheap])
+        cached = self._route_cache.get(cache_key)
+        if cached is not None:
+            if start_time - cached[0] < self.ROUTE_CACHE_TTL:
+                self._route_cache.move_to_end(cache_key)
+                return self._copy_decision(cached[1])
+            del self._route_cache[cache_key]
 
         # Analyze prompt to determine task categories
         categories = self._analyze_prompt(prompt)
 
         # Score all available agents
-        agent_scores = await self._score_agents(
+        agent_scores = self._score_agents(
             prompt, categories, context, prefer_fast, prefer_cheap
         )
 
@@ -293,10 +398,17 @@ class EnhancedAgentRouter:
             confidence_score=primary_confidence,
             reasoning=reasoning,
             estimated_latency_ms=estimated_latency,
-            estimated_cost=estimated_cost
+            estimated_cost=estimated_cost,
+            prompt_hash=prompt_hash
         )
 
-        routing_time_ms = (time.time() - start_time) * 1000
+        self._route_cache[cache_key] = (start_time, decision)
+        if len(self._route_cache) > self.ROUTE_CACHE_SIZE:
+            self._route_cache.popitem(last=False)
+        # The cached instance is never handed out, so callers can edit their chain
+        decision = self._copy_decision(decision)
+
+        routing_time_ms = (time.perf_counter() - start_time) * 1000
         self.logger.info(
             f"Routed to {primary_agent.value} (confidence: {primary_confidence:.2f}, "
             f"routing_time: {routing_time_ms:.1f}ms): {reasoning}"
@@ -304,14 +416,24 @@ class EnhancedAgentRouter:
 
         return decision
 
+    async def route_async(self, *args, **kwargs) -> RoutingDecision:
+        """Awaitable wrapper around route() for async callers"""
+        return self.route(*args, **kwargs)
+
     def _analyze_prompt(self, prompt: str) -> List[TaskCategory]:
         """Analyze prompt to determine relevant task categories"""
         prompt_lower = prompt.lower()
         categories_found = set()
 
-        for keyword, categories in self.keyword_map.items():
-            if keyword in prompt_lower:
-                categories_found.update(categories)
+        if self._keyword_ac is not None:
+            # Single pass over the prompt; overlapping so "research" also hits "search"
+            for index, _, _ in self._keyword_ac.find_matches_as_indexes(
+                prompt_lower, overlapping=True
+            ):
+                categories_found.update(self._keyword_categories[index])
+        else:
+            for match in self._keyword_re.finditer(prompt_lower):
+                categories_found.update(self.keyword_map[match.group(1)])
 
         # Default to GENERAL if no specific categories found
         if not categories_found:
@@ -319,7 +441,7 @@ class EnhancedAgentRouter:
 
         return list(categories_found)
 
-    async def _score_agents(
+    def _score_agents(
         self,
         prompt: str,
         categories: List[TaskCategory],
@@ -328,50 +450,46 @@ class EnhancedAgentRouter:
         prefer_cheap: bool
     ) -> Dict[AgentType, float]:
         """Score all agents for this task"""
-        scores = {}
-
-        for agent_type, capability in self.capabilities.items():
-            # Skip unavailable agents
-            if not capability.availability:
-                continue
+        order = self._agent_order
 
-            # Base score: category match
-            category_match = sum(
-                1 for cat in categories if cat in capability.categories
+        # Base score: category match, one matmul against the task's category counts
+        task_vec = np.bincount(
+            [self._category_index[cat] for cat in categories],
+            minlength=len(self._category_index),
+        )
+        scores = self._category_matrix @ task_vec / max(len(categories), 1)
+
+        # Confidence multiplier from capability
+        scores *= self._confidence_vec
+
+        # Success rate adjustment; penalize unhealthy agents
+        scores *= self._success_rate_vec
+        # Health ages with the failure window, so it is evaluated per call
+        scores *= np.where([self.metrics[a].is_healthy for a in order], 1.0, 0.5)
+
+        # Speed optimization
+        if prefer_fast:
+            # Favor faster agents
+            latency_s = self._latency_vec / 1000.0
+            scores *= 1.0 + (1.0 / latency_s) * 0.2
+
+        # Cost optimization
+        if prefer_cheap:
+            # Favor cheaper agents
+            cost = self._cost_vec
+            free = cost == 0
+            scores *= np.where(
+                free, 1.5, 1.0 + np.divide(0.1, cost, out=np.zeros_like(cost), where=~free)
             )
-            base_score = category_match / max(len(categories), 1)
-
-            # Confidence multiplier from capability
-            base_score *= capability.confidence_multiplier
-
-            # Performance-based adjustments
-            metrics = self.metrics[agent_type]
-
-            # Success rate adjustment
-            base_score *= metrics.success_rate
-
-            # Health check - penalize unhealthy agents
-            if not metrics.is_healthy:
-                base_score *= 0.5
 
-            # Speed optimization
-            if prefer_fast:
-                # Favor faster agents
-                speed_factor = 1.0 / (capability.average_latency_ms / 1000.0)
-                base_score *= (1.0 + speed_factor * 0.2)
+        np.minimum(scores, 1.0, out=scores)  # Cap at 1.0
 
-            # Cost optimization
-            if prefer_cheap:
-                # Favor cheaper agents
-                if capability.cost_per_task == 0:
-                    base_score *= 1.5
-                else:
-                    cost_factor = 1.0 / capability.cost_per_task
-                    base_score *= (1.0 + cost_factor * 0.1)
-
-            scores[agent_type] = min(base_score, 1.0)  # Cap at 1.0
-
-        return scores
+        # Skip unavailable agents
+        return {
+            agent_type: score
+            for agent_type, available, score in zip(order, self._available.tolist(), scores.tolist())
+            if available
+        }
 
     def _generate_reasoning(
         self,
@@ -398,7 +516,7 @@ class EnhancedAgentRouter:
 
         return "; ".join(reasoning_parts)
 
-    async def record_result(
+    def record_result(
         self,
         agent_type: AgentType,
         success: bool,
@@ -407,28 +525,41 @@ class EnhancedAgentRouter:
     ):
         """Record task result for adaptive learning"""
         metrics = self.metrics[agent_type]
+        capability = self.capabilities[agent_type]
+
+        # All counters, the latency average and the score arrays change together
+        with self._update_lock:
+            was_healthy = metrics.is_healthy
+            if success:
+                metrics.update_success(latency_ms)
+                # Update capability average latency with rolling average
+                alpha = 0.2  # Smoothing factor
+                capability.average_latency_ms = (
+                    alpha * latency_ms + (1 - alpha) * capability.average_latency_ms
+                )
+            else:
+                metrics.update_failure()
+            self._sync_agent_arrays(agent_type)
+            health_changed = metrics.is_healthy != was_healthy
+
+        if health_changed:
+            self._invalidate_route_cache()
 
         if success:
-            metrics.update_success(latency_ms)
             self.logger.debug(
                 f"{agent_type.value} task completed successfully "
                 f"({latency_ms:.0f}ms)"
             )
         else:
-            metrics.update_failure()
             self.logger.warning(
                 f"{agent_type.value} task failed: {error}"
             )
 
-        # Update capability average latency with rolling average
-        capability = self.capabilities[agent_type]
-        if success:
-            alpha = 0.2  # Smoothing factor
-            capability.average_latency_ms = (
-                alpha * latency_ms + (1 - alpha) * capability.average_latency_ms
-            )
+    async def record_result_async(self, *args, **kwargs):
+        """Awaitable wrapper around record_result() for async callers"""
+        self.record_result(*args, **kwargs)
 
-    async def get_fallback_agent(
+    def get_fallback_agent(
         self,
         failed_agent: AgentType,
         original_decision: RoutingDecision
@@ -457,6 +588,10 @@ class EnhancedAgentRouter:
         )
         return None
 
+    async def get_fallback_agent_async(self, *args, **kwargs) -> Optional[AgentType]:
+        """Awaitable wrapper around get_fallback_agent() for async callers"""
+        return self.get_fallback_agent(*args, **kwargs)
+
     def get_status(self) -> Dict[str, Any]:
         """Get router status for monitoring"""
         return {
@@ -477,12 +612,18 @@ class EnhancedAgentRouter:
 
     def enable_agent(self, agent_type: AgentType):
         """Enable an agent at runtime"""
-        self.capabilities[agent_type].availability = True
+        with self._update_lock:
+            self.capabilities[agent_type].availability = True
+            self._sync_agent_arrays(agent_type)
+        self._invalidate_route_cache()
         self.logger.info(f"Enabled agent: {agent_type.value}")
 
     def disable_agent(self, agent_type: AgentType):
         """Disable an agent at runtime"""
-        self.capabilities[agent_type].availability = False
+        with self._update_lock:
+            self.capabilities[agent_type].availability = False
+            self._sync_agent_arrays(agent_type)
+        self._invalidate_route_cache()
         self.logger.info(f"Disabled agent: {agent_type.value}")
 
 
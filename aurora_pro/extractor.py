@@ -1,60 +1,156 @@
 """
-Content extraction using trafilatura and newspaper3k with fallback.
+Content extraction using trafilatura with readability-lxml fallback.
 """
+import asyncio
+import hashlib
+import logging
+import multiprocessing as mp
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Dict, Any
 
 import httpx
+import lxml.html
 import trafilatura
-from newspaper import Article
+from readability import Document
+
+logger = logging.getLogger(__name__)
+
+MIN_HTML_LENGTH = 512  # heuristic floor: shorter bodies are almost never real articles
+SNIFF_BYTES = 4096
+_DOC_START_RE = re.compile(r"<(?:!doctype\s+html|html)[\s>]", re.IGNORECASE)
+_BODY_RE = re.compile(r"<body[\s>]", re.IGNORECASE)
+
+_EMPTY_RESULT = {"text": "", "title": None, "method": "failed"}
+
+
+def _looks_like_html(html: str) -> bool:
+    """Cheap pre-parse check that rejects short blobs, JSON and plain text.
+
+    Heuristic: inputs under ``MIN_HTML_LENGTH`` are skipped even if a tiny page
+    would have extracted, and so are HTML fragments with neither a
+    doctype/``<html>`` start nor a ``<body>`` tag.
+    """
+    if len(html) < MIN_HTML_LENGTH:
+        return False
+    return bool(_DOC_START_RE.search(html, 0, SNIFF_BYTES) or _BODY_RE.search(html))
 
 
 class ContentExtractor:
     """Extract and parse content from HTML."""
 
+    RESULT_CACHE_SIZE = 256
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Re-crawled pages: blake2b(html) -> extraction result
+        self._results: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+    def _cache_key(self, html: str) -> bytes:
+        return hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        result = self._results.get(key)
+        if result is None:
+            return None
+        self._results.move_to_end(key)
+        return dict(result)
+
+    def _cache_put(self, key: bytes, result: Dict[str, Any]):
+        self._results[key] = dict(result)
+        if len(self._results) > self.RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+
+    async def extract_async(self, html: str, url: str) -> Dict[str, Any]:
+        """Run extract() in a worker process so the event loop stays responsive."""
+        if not _looks_like_html(html):
+            return dict(_EMPTY_RESULT)
+        key = self._cache_key(html)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=mp.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._pool, _extract_in_worker, html, url)
+        self._cache_put(key, result)
+        return result
+
+    def close(self):
+        """Shut down the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
     def extract(self, html: str, url: str) -> Dict[str, Any]:
         """
-        Extract content using trafilatura with newspaper3k fallback.
+        Extract content using trafilatura with readability-lxml fallback.
 
         Returns:
             Dict with 'text', 'title', and 'method' keys
         """
-        # Try trafilatura first (fast and clean)
-        text = trafilatura.extract(
+        if not _looks_like_html(html):
+            return dict(_EMPTY_RESULT)
+        key = self._cache_key(html)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = self._extract_html(html, url)
+        self._cache_put(key, result)
+        return result
+
+    def _extract_html(self, html: str, url: str) -> Dict[str, Any]:
+        # Try trafilatura first (fast and clean); text and metadata from one parse
+        result = trafilatura.bare_extraction(
             html,
             include_comments=False,
             include_tables=True,
-            no_fallback=False
+            no_fallback=False,
+            with_metadata=True
         )
+        if result is not None and not isinstance(result, dict):
+            result = result.as_dict()  # trafilatura 2.x returns a Document
+        text = result.get("text") if result else None
 
         if text and len(text.strip()) > 100:
-            # Extract metadata for title
-            metadata = trafilatura.extract_metadata(html)
-            title = metadata.title if metadata and metadata.title else None
-
             return {
                 "text": text,
-                "title": title,
+                "title": result.get("title") or None,
                 "method": "trafilatura"
             }
 
-        # Fallback to newspaper3k
+        # Fallback to readability-lxml
         try:
-            article = Article(url)
-            article.download(input_html=html)
-            article.parse()
+            doc = Document(html)
+            fallback_text = lxml.html.fromstring(doc.summary()).text_content()
 
-            if article.text and len(article.text.strip()) > 100:
+            if fallback_text and len(fallback_text.strip()) > 100:
                 return {
-                    "text": article.text,
-                    "title": article.title or None,
-                    "method": "newspaper3k"
+                    "text": fallback_text,
+                    "title": doc.short_title() or None,
+                    "method": "readability"
                 }
         except Exception as e:
-            print(f"Newspaper3k extraction failed: {e}")
+            logger.warning(f"Readability extraction failed: {e}")
 
         # Last resort: return empty
-        return {
-            "text": "",
-            "title": None,
-            "method": "failed"
-        }
\ No newline at end of file
+        return dict(_EMPTY_RESULT)
+
+
+_worker_extractor: Optional[ContentExtractor] = None
+
+
+def _extract_in_worker(html: str, url: str) -> Dict[str, Any]:
+    """Process-pool entry point; the instance holding the pool can't be pickled."""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = ContentExtractor()
+    return _worker_extractor._extract_html(html, url)
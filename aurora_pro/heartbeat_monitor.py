@@ -10,14 +10,17 @@ Periodically records system health metrics including:
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import itertools
 import logging
 import time
-from datetime import datetime
-from pathlib import Path
+import types
+from collections import deque
 from typing import Any, Dict, Optional
 
-import aiofiles
+import orjson
+
+from async_appender import AsyncAppender, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
@@ -28,14 +31,22 @@ class HeartbeatMonitor:
     HEARTBEAT_LOG_PATH = "/root/aurora_pro/logs/heartbeat.log"
     HEARTBEAT_INTERVAL = 60  # seconds
     RECOVERY_LOG_PATH = "/root/aurora_pro/logs/recovery_events.log"
+    RECOVERY_EVENTS_KEPT = 100
+    MAX_ERROR_COMPONENTS = 256  # distinct component names tracked in _error_counts
+    # Fixed head of every heartbeat line; the health fields are spliced in after it
+    HEARTBEAT_PREFIX = b'{"timestamp":"%s","type":"heartbeat"'
 
     def __init__(self):
         self._running = False
         self._heartbeat_task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
         self._start_time = time.time()
         self._last_heartbeat = 0.0
         self._error_counts: Dict[str, int] = {}
-        self._recovery_events: list = []
+        # Keep only last RECOVERY_EVENTS_KEPT recovery events in memory
+        self._recovery_events: deque = deque(maxlen=self.RECOVERY_EVENTS_KEPT)
+        # One long-lived handle per log; lines written in batches
+        self._appender = AsyncAppender()
 
     async def start(self):
         """Start the heartbeat monitor."""
@@ -43,6 +54,7 @@ class HeartbeatMonitor:
             return
 
         self._running = True
+        self._stop_event = asyncio.Event()
         self._start_time = time.time()
         self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
         logger.info("Heartbeat monitor started")
@@ -50,22 +62,27 @@ class HeartbeatMonitor:
     async def stop(self):
         """Stop the heartbeat monitor."""
         self._running = False
+        self._stop_event.set()
         if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
+            # The loop exits at its next wait; never interrupted mid-write
+            await self._heartbeat_task
+            self._heartbeat_task = None
+        await self._appender.close()
         logger.info("Heartbeat monitor stopped")
 
     async def record_error(self, component: str, error: str):
         """Record an error for a component."""
-        self._error_counts[component] = self._error_counts.get(component, 0) + 1
+        counts = self._error_counts
+        count = counts.get(component)
+        if count is None and len(counts) >= self.MAX_ERROR_COMPONENTS:
+            # Bounded: forget the longest-tracked component
+            del counts[next(iter(counts))]
+        counts[component] = (count or 0) + 1
         logger.warning(f"Error recorded for {component}: {error}")
 
     async def record_recovery(self, component: str, event_type: str, details: Optional[Dict] = None):
         """Record a recovery event."""
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
+        timestamp = utc_timestamp()
         event = {
             "timestamp": timestamp,
             "component": component,
@@ -74,22 +91,25 @@ class HeartbeatMonitor:
         }
         self._recovery_events.append(event)
 
-        # Keep only last 100 recovery events in memory
-        if len(self._recovery_events) > 100:
-            self._recovery_events.pop(0)
-
         # Write to recovery log
         await self._write_recovery_log(event)
         logger.info(f"Recovery event: {component} - {event_type}")
 
+    def _recent_recovery_events(self, limit: int) -> list:
+        """Newest ``limit`` recovery events, oldest first."""
+        recent = list(itertools.islice(reversed(self._recovery_events), limit))
+        recent.reverse()
+        return recent
+
     async def get_health_status(self) -> Dict[str, Any]:
         """Get current health status."""
         uptime = time.time() - self._start_time
         return {
             "uptime_seconds": round(uptime, 2),
             "last_heartbeat": self._last_heartbeat,
-            "error_counts": dict(self._error_counts),
-            "recent_recovery_events": self._recovery_events[-10:],
+            # Live read-only view; callers that keep it must copy
+            "error_counts": types.MappingProxyType(self._error_counts),
+            "recent_recovery_events": self._recent_recovery_events(10),
             "running": self._running,
         }
 
@@ -101,7 +121,7 @@ class HeartbeatMonitor:
     ) -> Dict[str, Any]:
         """Gather health status from all components."""
         health = {
-            "timestamp": datetime.utcnow().isoformat(timespec="milliseconds") + "Z",
+            "timestamp": utc_timestamp(),
             "uptime_seconds": round(time.time() - self._start_time, 2),
             "components": {},
         }
@@ -153,16 +173,21 @@ class HeartbeatMonitor:
                 await self.record_error("coordinator", str(exc))
 
         # Add error counts and recovery events
-        health["error_counts"] = dict(self._error_counts)
-        health["recent_recovery_events"] = self._recovery_events[-5:]
+        health["error_counts"] = types.MappingProxyType(self._error_counts)
+        health["recent_recovery_events"] = self._recent_recovery_events(5)
 
         return health
 
     async def _heartbeat_loop(self):
-        """Periodic heartbeat loop."""
+        """Periodic heartbeat loop; returns once stop() sets the stop event."""
+        loop = asyncio.get_running_loop()
+        next_beat = loop.time() + self.HEARTBEAT_INTERVAL
         while self._running:
             try:
-                await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+                # Monotonic schedule, so slow writes don't push later beats back
+                if await self._wait_for_stop(next_beat - loop.time()):
+                    return
+                next_beat += self.HEARTBEAT_INTERVAL
 
                 # Update timestamp
                 self._last_heartbeat = time.time()
@@ -178,54 +203,39 @@ class HeartbeatMonitor:
                 raise
             except Exception as exc:
                 logger.error(f"Heartbeat loop error: {exc}", exc_info=True)
-                await asyncio.sleep(5)  # Brief pause on error
+                # Brief pause on error
+                if await self._wait_for_stop(5):
+                    return
+                next_beat = loop.time() + self.HEARTBEAT_INTERVAL
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds; True if stop() was requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=max(timeout, 0))
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     async def _write_heartbeat(self, health: Dict[str, Any]):
         """Write heartbeat entry to log."""
-        timestamp = datetime.utcnow().isoformat(timespec="milliseconds") + "Z"
-        entry = {
-            "timestamp": timestamp,
-            "type": "heartbeat",
-            **health,
-        }
-
-        line = json.dumps(entry) + "\n"
-
-        # Ensure log directory exists
-        log_path = Path(self.HEARTBEAT_LOG_PATH)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            async with aiofiles.open(self.HEARTBEAT_LOG_PATH, "a") as f:
-                await f.write(line)
-        except Exception as exc:
-            logger.error(f"Failed to write heartbeat: {exc}")
+        # Serialize health as-is and splice it behind the fixed prefix instead of
+        # merging it into a new dict; default=dict handles the error_counts view
+        body = orjson.dumps(health, default=dict, option=orjson.OPT_APPEND_NEWLINE)
+        head = self.HEARTBEAT_PREFIX % utc_timestamp().encode()
+        line = head + b"," + body[1:] if len(body) > 3 else head + b"}\n"
+        await self._appender.put(self.HEARTBEAT_LOG_PATH, line)
 
     async def _write_recovery_log(self, event: Dict[str, Any]):
         """Write recovery event to log."""
-        line = json.dumps(event) + "\n"
-
-        # Ensure log directory exists
-        log_path = Path(self.RECOVERY_LOG_PATH)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        try:
-            async with aiofiles.open(self.RECOVERY_LOG_PATH, "a") as f:
-                await f.write(line)
-        except Exception as exc:
-            logger.error(f"Failed to write recovery log: {exc}")
+        line = orjson.dumps(event, option=orjson.OPT_APPEND_NEWLINE)
+        await self._appender.put(self.RECOVERY_LOG_PATH, line)
 
 
 # Global singleton
-_monitor_instance: Optional[HeartbeatMonitor] = None
-
-
+@functools.cache
 def get_heartbeat_monitor() -> HeartbeatMonitor:
     """Get or create the global heartbeat monitor instance."""
-    global _monitor_instance
-    if _monitor_instance is None:
-        _monitor_instance = HeartbeatMonitor()
-    return _monitor_instance
+    return HeartbeatMonitor()
 
 
 __all__ = ["HeartbeatMonitor", "get_heartbeat_monitor"]
\ No newline at end of file
@@ -2,12 +2,15 @@
 SSRF-safe HTTP client with rate limiting and retry logic.
 """
 import asyncio
+import logging
+import re
+import time
 import urllib.robotparser
-from typing import Optional
-from urllib.parse import urljoin, urlparse
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+from urllib.parse import ParseResult, quote, unquote, urljoin, urlparse, urlunparse
 
 import httpx
-from aiolimiter import AsyncLimiter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -17,18 +20,106 @@ from tenacity import (
 
 from ssrf_protection import SSRFProtection
 
+try:
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTP2_AVAILABLE = True
+except ImportError:  # optional - falls back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class _TTLCache:
+    """Size-bounded LRU whose entries also expire ``ttl`` seconds after insert."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _RobotsRules:
+    """One user agent's robots.txt rules compiled into a single anchored regex.
+
+    Same answers as ``RobotFileParser.can_fetch``: the rule lines become
+    ordered alternatives, so the first line whose path prefixes the URL wins.
+    """
+
+    def __init__(self, rp: urllib.robotparser.RobotFileParser, useragent: str):
+        self.disallow_all = rp.disallow_all
+        self.allow_all = rp.allow_all
+        self.checked = bool(rp.last_checked)
+
+        entry = next((e for e in rp.entries if e.applies_to(useragent)), rp.default_entry)
+        rules = entry.rulelines if entry else []
+        self.allowances = [rule.allowance for rule in rules]
+        self.pattern = re.compile("|".join(
+            "()" if rule.path == "*" else f"({re.escape(rule.path)})" for rule in rules
+        )) if rules else None
+
+    def can_fetch(self, url: str) -> bool:
+        if self.disallow_all:
+            return False
+        if self.allow_all:
+            return True
+        if not self.checked:
+            return False
+        if self.pattern is None:
+            return True
+        parsed_url = urlparse(unquote(url))
+        path = quote(urlunparse(
+            ("", "", parsed_url.path, parsed_url.params, parsed_url.query, parsed_url.fragment)
+        )) or "/"
+        match = self.pattern.match(path)
+        return True if match is None else self.allowances[match.lastindex - 1]
+
 
 class SafeHTTPClient:
     """HTTP client with SSRF protection, rate limiting, and robots.txt respect."""
 
+    USER_AGENT = "Aurora-Bot"
+    CACHE_MAX_DOMAINS = 1024
+    ROBOTS_TTL = 3600  # seconds before robots.txt is re-fetched
+    ROBOTS_MAX_CHARS = 500 * 1024  # rest of an oversized robots.txt is ignored
+    RATE_LIMITER_TTL = 600  # seconds an idle domain's limiter is kept
+    RATE_PER_SECOND = 5  # requests per domain
+    RATE_BURST = 5  # requests a quiet domain may send back-to-back
+
     def __init__(self):
         self.ssrf = SSRFProtection()
-        # Rate limiter: 5 requests per second per domain
-        self.rate_limiters = {}
-        self.robots_cache = {}
+        # Rate limiter: 5 requests per second per domain, as one float per domain
+        # (GCRA theoretical arrival time on the loop clock)
+        self.rate_limiters = _TTLCache(self.CACHE_MAX_DOMAINS, self.RATE_LIMITER_TTL)
+        self.robots_cache = _TTLCache(self.CACHE_MAX_DOMAINS, self.ROBOTS_TTL)
         self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,  # multiplex requests to a host over one connection
             follow_redirects=False,  # We validate redirects manually
-            timeout=30.0
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=100,
+                max_connections=200,
+                keepalive_expiry=60
+            )
         )
 
     async def __aenter__(self):
@@ -37,39 +128,56 @@ class SafeHTTPClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.client.aclose()
 
-    def _get_rate_limiter(self, domain: str) -> AsyncLimiter:
-        """Get or create rate limiter for domain."""
-        if domain not in self.rate_limiters:
-            # 5 requests per second, max burst of 10
-            self.rate_limiters[domain] = AsyncLimiter(5, 1.0)
-        return self.rate_limiters[domain]
-
-    async def _check_robots_txt(self, url: str) -> bool:
-        """Check if URL is allowed by robots.txt."""
-        parsed = urlparse(url)
+    async def _wait_for_rate_limit(self, domain: str) -> None:
+        """Wait until ``domain`` may be requested again, then claim that slot."""
+        interval = 1.0 / self.RATE_PER_SECOND
+        now = asyncio.get_running_loop().time()
+        arrival = max(self.rate_limiters.get(domain, now), now)
+        # Claimed before sleeping, so concurrent callers queue behind each other
+        self.rate_limiters[domain] = arrival + interval
+        delay = arrival - now - interval * (self.RATE_BURST - 1)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _check_robots_txt(self, url: str, parsed: ParseResult) -> bool:
+        """Check if URL (already parsed as ``parsed``) is allowed by robots.txt."""
         base_url = f"{parsed.scheme}://{parsed.netloc}"
-        robots_url = urljoin(base_url, "/robots.txt")
 
-        if base_url not in self.robots_cache:
-            rp = urllib.robotparser.RobotFileParser()
-            rp.set_url(robots_url)
-
-            try:
-                # Fetch robots.txt without SSRF check (same domain)
-                response = await self.client.get(robots_url, timeout=5.0)
+        # Single-flight: concurrent cold-start fetches share one robots.txt load
+        task = self.robots_cache.get(base_url)
+        if task is None:
+            robots_url = f"{base_url}/robots.txt"
+            task = asyncio.create_task(self._load_robots_txt(robots_url))
+            self.robots_cache[base_url] = task
+
+        # Shielded so one cancelled caller doesn't abort the load for the others
+        rules = await asyncio.shield(task)
+        return rules.can_fetch(url)
+
+    async def _load_robots_txt(self, robots_url: str) -> _RobotsRules:
+        """Fetch, parse and compile robots.txt; any failure allows everything."""
+        rp = urllib.robotparser.RobotFileParser()
+        rp.set_url(robots_url)
+
+        try:
+            # Fetch robots.txt without SSRF check (same domain)
+            lines = []
+            async with self.client.stream("GET", robots_url, timeout=5.0) as response:
                 if response.status_code == 200:
-                    rp.parse(response.text.splitlines())
-                else:
-                    # No robots.txt or error - allow by default
-                    rp.parse([])
-            except Exception:
-                # Error fetching robots.txt - allow by default
-                rp.parse([])
-
-            self.robots_cache[base_url] = rp
-
-        rp = self.robots_cache[base_url]
-        return rp.can_fetch("Aurora-Bot", url)
+                    # Streamed line by line, so a huge body is never buffered whole
+                    budget = self.ROBOTS_MAX_CHARS
+                    async for line in response.aiter_lines():
+                        budget -= len(line)
+                        if budget < 0:
+                            break
+                        lines.append(line)
+            # No robots.txt or error - allow by default
+            rp.parse(lines)
+        except Exception:
+            # Error fetching robots.txt - allow by default
+            rp.parse([])
+
+        return _RobotsRules(rp, self.USER_AGENT)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -88,51 +196,60 @@ class SafeHTTPClient:
             Response object or None if blocked/failed
         """
         current_url = url
+        # Parsed once per hop and shared by SSRF, robots.txt and rate limiting
+        parsed = urlparse(current_url)
+        validated = False  # redirect targets are SSRF-checked before the next hop
         redirect_count = 0
 
         while redirect_count <= max_redirects:
             # SSRF validation
-            is_valid, error_msg = self.ssrf.validate_url(current_url)
-            if not is_valid:
-                print(f"SSRF check failed for {current_url}: {error_msg}")
-                return None
+            if not validated:
+                is_valid, error_msg = self.ssrf.validate_url(current_url, parsed)
+                if not is_valid:
+                    logger.warning(f"SSRF check failed for {current_url}: {error_msg}")
+                    return None
 
             # Check robots.txt
-            if not await self._check_robots_txt(current_url):
-                print(f"Blocked by robots.txt: {current_url}")
+            if not await self._check_robots_txt(current_url, parsed):
+                logger.info(f"Blocked by robots.txt: {current_url}")
                 return None
 
             # Rate limiting
-            parsed = urlparse(current_url)
-            limiter = self._get_rate_limiter(parsed.netloc)
-            async with limiter:
-                try:
-                    response = await self._fetch_with_retry(current_url)
-
-                    # Handle redirects manually for SSRF validation
-                    if response.status_code in (301, 302, 303, 307, 308):
-                        location = response.headers.get("Location")
-                        if not location:
-                            return None
-
-                        # Make absolute URL
+            await self._wait_for_rate_limit(parsed.netloc)
+            try:
+                response = await self._fetch_with_retry(current_url)
+
+                # Handle redirects manually for SSRF validation
+                if response.status_code in (301, 302, 303, 307, 308):
+                    location = response.headers.get("Location")
+                    if not location:
+                        return None
+
+                    # Make absolute URL; urljoin only when there is something to
+                    # resolve (relative location or dot segments to collapse)
+                    if location.startswith(("http://", "https://")) and "/." not in location:
+                        next_url = location
+                    else:
                         next_url = urljoin(current_url, location)
+                    next_parsed = urlparse(next_url)
 
-                        # Validate redirect target
-                        is_valid, error_msg = self.ssrf.validate_redirect(current_url, next_url)
-                        if not is_valid:
-                            print(f"Redirect blocked: {next_url}: {error_msg}")
-                            return None
+                    # Validate redirect target
+                    is_valid, error_msg = self.ssrf.validate_redirect(
+                        current_url, next_url, next_parsed
+                    )
+                    if not is_valid:
+                        logger.warning(f"Redirect blocked: {next_url}: {error_msg}")
+                        return None
 
-                        current_url = next_url
-                        redirect_count += 1
-                        continue
+                    current_url, parsed, validated = next_url, next_parsed, True
+                    redirect_count += 1
+                    continue
 
-                    return response
+                return response
 
-                except Exception as e:
-                    print(f"Fetch failed for {current_url}: {e}")
-                    return None
+            except Exception as e:
+                logger.warning(f"Fetch failed for {current_url}: {e}")
+                return None
 
-        print(f"Too many redirects for {url}")
+        logger.warning(f"Too many redirects for {url}")
         return None
\ No newline at end of file
@@ -28,6 +28,19 @@ from typing import Any, Dict, List, Optional, Tuple
 import aiofiles
 import httpx
 
+try:
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTP2_AVAILABLE = True
+except ImportError:  # optional - falls back to HTTP/1.1 keep-alive
+    HTTP2_AVAILABLE = False
+
+try:
+    import aiohttp
+    from httpx_aiohttp import AiohttpTransport
+    AIOHTTP_TRANSPORT_AVAILABLE = True
+except ImportError:  # optional - AURORA_HTTP_BACKEND=aiohttp needs httpx-aiohttp
+    AIOHTTP_TRANSPORT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,6 +120,15 @@ class LLMOrchestrator:
     AUDIT_LOG_PATH = "/root/aurora_pro/logs/llm_orchestrator.log"
     STATS_PATH = "/root/aurora_pro/logs/llm_stats.json"
 
+    # One pooled client per API host: base URL and read timeout (seconds)
+    API_HOSTS = {
+        "anthropic": ("https://api.anthropic.com", 60.0),
+        "openai": ("https://api.openai.com", 60.0),
+        "google": ("https://generativelanguage.googleapis.com", 60.0),
+        "ollama": ("http://localhost:11434", 120.0),
+    }
+    AIOHTTP_CONNECTION_LIMIT = 200  # per host, when AURORA_HTTP_BACKEND=aiohttp
+
     # Cost per 1K tokens (estimated, adjust as needed)
     COSTS = {
         LLMProvider.CLAUDE_SONNET: {"input": 0.003, "output": 0.015},
@@ -170,12 +192,19 @@ class LLMOrchestrator:
         self._running = False
         self._stats: Dict[LLMProvider, LLMStats] = {}
         self._lock = asyncio.Lock()
+        self._clients: Dict[str, httpx.AsyncClient] = {}
 
         # API keys from environment
         self._anthropic_key = os.getenv("ANTHROPIC_API_KEY")
         self._openai_key = os.getenv("OPENAI_API_KEY")
         self._google_key = os.getenv("GOOGLE_API_KEY")
 
+        # Opt-in aiohttp connection pool under the same httpx API (voting fan-out)
+        self._use_aiohttp = os.getenv("AURORA_HTTP_BACKEND", "httpx").lower() == "aiohttp"
+        if self._use_aiohttp and not AIOHTTP_TRANSPORT_AVAILABLE:
+            logger.warning("AURORA_HTTP_BACKEND=aiohttp but httpx-aiohttp is not installed; using httpx")
+            self._use_aiohttp = False
+
         # Initialize stats for all providers
         for provider in LLMProvider:
             self._stats[provider] = LLMStats(provider=provider)
@@ -183,6 +212,8 @@ class LLMOrchestrator:
     async def start(self):
         """Initialize orchestrator."""
         self._running = True
+        for host in self.API_HOSTS:
+            self._client(host)
         await self._load_stats()
         await self._audit_log("system", "LLM Orchestrator started")
         logger.info("LLM Orchestrator initialized")
@@ -190,9 +221,37 @@ class LLMOrchestrator:
     async def stop(self):
         """Shutdown orchestrator."""
         self._running = False
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients), return_exceptions=True)
         await self._save_stats()
         await self._audit_log("system", "LLM Orchestrator stopped")
 
+    def _client(self, host: str) -> httpx.AsyncClient:
+        """Shared keep-alive client for ``host``; created on first use if start() wasn't called."""
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            base_url, read_timeout = self.API_HOSTS[host]
+            client = self._clients[host] = httpx.AsyncClient(
+                base_url=base_url,
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(read_timeout, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=30,
+                ),
+                transport=self._aiohttp_transport() if self._use_aiohttp else None,
+            )
+        return client
+
+    def _aiohttp_transport(self) -> "AiohttpTransport":
+        """httpx transport backed by an aiohttp session, opened on first request."""
+        limit = self.AIOHTTP_CONNECTION_LIMIT
+        return AiohttpTransport(
+            client=lambda: aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=limit))
+        )
+
     async def generate(
         self,
         prompt: str,
@@ -383,7 +442,6 @@ class LLMOrchestrator:
         if not self._anthropic_key:
             raise ValueError("ANTHROPIC_API_KEY not set")
 
-        url = "https://api.anthropic.com/v1/messages"
         headers = {
             "x-api-key": self._anthropic_key,
             "anthropic-version": "2023-06-01",
@@ -401,10 +459,9 @@ class LLMOrchestrator:
             data["system"] = system_prompt
 
         start_time = time.time()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            result = response.json()
+        response = await self._client("anthropic").post("/v1/messages", headers=headers, json=data)
+        response.raise_for_status()
+        result = response.json()
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -435,7 +492,6 @@ class LLMOrchestrator:
         if not self._openai_key:
             raise ValueError("OPENAI_API_KEY not set")
 
-        url = "https://api.openai.com/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {self._openai_key}",
             "Content-Type": "application/json",
@@ -456,10 +512,9 @@ class LLMOrchestrator:
             data["max_tokens"] = max_tokens
 
         start_time = time.time()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            result = response.json()
+        response = await self._client("openai").post("/v1/chat/completions", headers=headers, json=data)
+        response.raise_for_status()
+        result = response.json()
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -491,7 +546,7 @@ class LLMOrchestrator:
             raise ValueError("GOOGLE_API_KEY not set")
 
         model_name = "gemini-1.5-pro" if provider == LLMProvider.GEMINI_PRO else "gemini-1.5-flash"
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent?key={self._google_key}"
+        path = f"/v1beta/models/{model_name}:generateContent"
 
         full_prompt = prompt
         if system_prompt:
@@ -508,10 +563,9 @@ class LLMOrchestrator:
             data["generationConfig"]["maxOutputTokens"] = max_tokens
 
         start_time = time.time()
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, json=data)
-            response.raise_for_status()
-            result = response.json()
+        response = await self._client("google").post(path, params={"key": self._google_key}, json=data)
+        response.raise_for_status()
+        result = response.json()
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -543,7 +597,6 @@ class LLMOrchestrator:
     ) -> LLMResponse:
         """Call local Ollama API."""
         model_name = provider.value.replace("ollama-", "")
-        url = "http://localhost:11434/api/generate"
 
         full_prompt = prompt
         if system_prompt:
@@ -557,10 +610,9 @@ class LLMOrchestrator:
         }
 
         start_time = time.time()
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(url, json=data)
-            response.raise_for_status()
-            result = response.json()
+        response = await self._client("ollama").post("/api/generate", json=data)
+        response.raise_for_status()
+        result = response.json()
 
         latency_ms = (time.time() - start_time) * 1000
 
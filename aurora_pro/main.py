@@ -146,6 +146,8 @@ async def lifespan(app: FastAPI):
 
     await db.initialize()
     browser_agent = BrowserAgent()
+    # Overlap chromedriver install/launch with the rest of startup
+    browser_agent.warmup()
     system_controller = KaliSystemController()
     coordinator = AICoordinator(browser_agent, system_controller, db, analyzer)
     await coordinator.start()
@@ -239,6 +241,8 @@ async def lifespan(app: FastAPI):
             await browser_agent.shutdown()
         if input_agent:
             await input_agent.stop()
+        extractor.close()
+        await db.close()
 
 
 app = FastAPI(
@@ -305,7 +309,7 @@ async def analyze_url(request: AnalyzeRequest):
 
         # Extract content
         html = response.text
-        extracted = extractor.extract(html, url)
+        extracted = await extractor.extract_async(html, url)
 
         if not extracted["text"]:
             REQUESTS_TOTAL.labels(endpoint="analyze", status="extraction_failed").inc()
@@ -344,6 +348,23 @@ async def analyze_url(request: AnalyzeRequest):
         raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
 
+@app.get("/evidence/search", response_model=EvidenceListResponse)
+async def search_evidence(q: str, limit: int = 20):
+    """Full-text search over evidence URLs and titles, best match first."""
+    if limit > 1000:
+        raise HTTPException(status_code=400, detail="Limit cannot exceed 1000")
+
+    results = await db.search_evidence(q, limit=limit)
+
+    REQUESTS_TOTAL.labels(endpoint="search_evidence", status="success").inc()
+    return EvidenceListResponse(
+        total=len(results),
+        limit=limit,
+        offset=0,
+        results=results
+    )
+
+
 @app.get("/evidence/{evidence_id}", response_model=AnalyzeResponse)
 async def get_evidence(evidence_id: str):
     """Retrieve evidence by ID."""
@@ -1253,7 +1274,7 @@ async def control_metrics():
     if control_center is None:
         raise HTTPException(status_code=503, detail="Control Center not ready")
 
-    status = await control_center._collect_full_status()
+    status = await control_center.get_full_status()
     REQUESTS_TOTAL.labels(endpoint="control_metrics", status="success").inc()
     return status
 
@@ -4,8 +4,8 @@ Implements domain allowlisting and private IP blocking per OWASP SSRF guidelines
 """
 import ipaddress
 import socket
-from urllib.parse import urlparse
-from typing import Set, Tuple
+from urllib.parse import ParseResult, urlparse
+from typing import Optional, Set, Tuple
 
 
 class SSRFProtection:
@@ -36,15 +36,20 @@ class SSRFProtection:
         """Initialize with optional custom allowed domains."""
         self.allowed_domains = allowed_domains or self.ALLOWED_DOMAINS
 
-    def validate_url(self, url: str) -> Tuple[bool, str]:
+    def validate_url(self, url: str, parsed: Optional[ParseResult] = None) -> Tuple[bool, str]:
         """
         Validate URL for SSRF safety.
 
+        Args:
+            url: URL to validate
+            parsed: ``urlparse(url)`` if the caller already has it
+
         Returns:
             (is_valid, error_message)
         """
         try:
-            parsed = urlparse(url)
+            if parsed is None:
+                parsed = urlparse(url)
 
             # Check scheme
             if parsed.scheme not in ("http", "https"):
@@ -82,6 +87,11 @@ class SSRFProtection:
         except Exception as e:
             return False, f"Validation error: {e}"
 
-    def validate_redirect(self, original_url: str, redirect_url: str) -> Tuple[bool, str]:
+    def validate_redirect(
+        self,
+        original_url: str,
+        redirect_url: str,
+        parsed: Optional[ParseResult] = None
+    ) -> Tuple[bool, str]:
         """Validate redirect target using same SSRF rules."""
-        return self.validate_url(redirect_url)
\ No newline at end of file
+        return self.validate_url(redirect_url, parsed)
\ No newline at end of file
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# aurora_pro modules import each other as top-level modules (e.g. ``from ssrf_protection import ...``)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "aurora_pro"))
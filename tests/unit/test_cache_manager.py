@@ -0,0 +1,63 @@
+import asyncio
+import gc
+import weakref
+
+from cache_manager import MemoryCache
+
+
+def test_memory_cache_lru_eviction_order():
+    async def scenario():
+        cache = MemoryCache(max_size_mb=1)
+        payload = b"x" * (300 * 1024)
+        await cache.set("a", payload)
+        await cache.set("b", payload)
+        await cache.set("c", payload)
+        # Touch "a" so "b" becomes least recently used.
+        assert await cache.get("a") == payload
+        await cache.set("d", payload)
+        assert await cache.get("b") is None
+        assert await cache.get("a") == payload
+        stats = await cache.get_stats()
+        assert stats["entries"] == 3
+        assert stats["evictions"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_memory_cache_overwrite_and_delete_track_size():
+    async def scenario():
+        cache = MemoryCache(max_size_mb=1)
+        await cache.set("k", "v1")
+        await cache.set("k", "v2")
+        assert await cache.get("k") == "v2"
+        await cache.delete("k")
+        assert cache._current_size_bytes == 0
+        assert await cache.get("k") is None
+
+    asyncio.run(scenario())
+
+
+class _Payload:
+    def __init__(self, size):
+        self.data = b"x" * size
+
+
+def test_memory_cache_eviction_frees_values_without_cyclic_gc():
+    async def scenario():
+        cache = MemoryCache(max_size_mb=1)
+        refs = []
+        for key in ("a", "b", "c"):
+            value = _Payload(300 * 1024)
+            refs.append(weakref.ref(value))
+            await cache.set(key, value)
+        del value
+        # Evicts "a" and "b" together
+        await cache.set("d", b"x" * (600 * 1024))
+        return refs
+
+    gc.disable()
+    try:
+        refs = asyncio.run(scenario())
+        assert refs[0]() is None and refs[1]() is None
+    finally:
+        gc.enable()
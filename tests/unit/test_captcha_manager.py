@@ -0,0 +1,40 @@
+import asyncio
+
+import pytest
+
+from captcha_manager import CaptchaManager, CaptchaType
+
+
+@pytest.mark.parametrize(
+    "page, expected",
+    [
+        ('<div class="g-recaptcha" data-sitekey="abc"></div>', CaptchaType.RECAPTCHA_V2),
+        ('<script src="https://www.google.com/recaptcha/api.js"></script>', CaptchaType.RECAPTCHA_V3),
+        ('<div class="G-RECAPTCHA"></div><script>grecaptcha.execute()</script>', CaptchaType.RECAPTCHA_V3),
+        ('<div class="h-captcha" data-sitekey="xyz"></div>', CaptchaType.HCAPTCHA),
+        (b'<script src="https://hcaptcha.com/1/api.js"></script>', CaptchaType.HCAPTCHA),
+        ("<script>grecaptcha.execute()</script>", None),
+        ("<html><body>plain page</body></html>", None),
+    ],
+)
+def test_detect_captcha_type(page, expected):
+    manager = CaptchaManager()
+    assert asyncio.run(manager.detect_captcha_type(page)) == expected
+
+
+@pytest.mark.parametrize("bad_type", ["not-a-captcha", CaptchaType.IMAGE.value])
+def test_solve_many_rejects_invalid_batch_before_submitting(monkeypatch, bad_type):
+    manager = CaptchaManager()
+    submitted = []
+
+    async def fake_solve(**kwargs):
+        submitted.append(kwargs)
+
+    monkeypatch.setattr(manager, "solve_hcaptcha", fake_solve)
+    requests = [
+        {"captcha_type": CaptchaType.HCAPTCHA.value, "site_key": "k", "page_url": "https://a.example"},
+        {"captcha_type": bad_type, "site_key": "k", "page_url": "https://b.example"},
+    ]
+    with pytest.raises(ValueError):
+        asyncio.run(manager.solve_many(requests))
+    assert submitted == []
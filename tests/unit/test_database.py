@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from database import Database
+
+
+def test_database_roundtrip_on_shared_connection(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "aurora.db"))
+        await db.initialize()
+        try:
+            # Cached results must be invalidated by the inserts below
+            assert await db.count_evidence() == 0
+            assert await db.list_evidence() == []
+
+            low = await db.insert_evidence("https://a.example", "A", 0.2, {"k": 1})
+            high = await db.insert_evidence("https://b.example", None, 0.9, {})
+
+            record = await db.get_evidence(low)
+            assert record["url"] == "https://a.example"
+            assert record["facets"] == {"k": 1}
+            assert await db.get_evidence("missing") is None
+
+            listed = await db.list_evidence()
+            assert [r["id"] for r in listed] == [high, low]
+            assert await db.count_evidence() == 2
+            assert await db.count_evidence(min_score=0.5) == 1
+        finally:
+            await db.close()
+
+    asyncio.run(scenario())
+
+
+def test_database_batches_concurrent_and_bulk_inserts(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "aurora.db"))
+        await db.initialize()
+        try:
+            ids = await asyncio.gather(
+                *(db.insert_evidence(f"https://{i}.example", None, i / 10, {}) for i in range(5))
+            )
+            bulk = await db.insert_evidence_many(
+                [{"url": "https://bulk.example", "title": "B", "score": 1.0, "facets": {"n": 2}}]
+            )
+            assert len(set(ids)) == 5
+            assert (await db.get_evidence(bulk[0]))["facets"] == {"n": 2}
+            assert await db.count_evidence() == 6
+        finally:
+            await db.close()
+
+    asyncio.run(scenario())
+
+
+def test_database_full_text_search_ranks_and_tolerates_bad_syntax(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "aurora.db"))
+        await db.initialize()
+        try:
+            await db.insert_evidence_many([
+                {"url": "https://a.example/agents", "title": "Browser agents", "score": 0.5},
+                {"url": "https://b.example/db", "title": "SQLite tuning", "score": 0.5},
+            ])
+            hits = await db.search_evidence("agent")
+            assert [h["title"] for h in hits] == ["Browser agents"]
+            assert await db.search_evidence('sqlite "') != []
+        finally:
+            await db.close()
+
+    asyncio.run(scenario())
+
+
+def test_database_dedupes_identical_evidence(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "aurora.db"))
+        await db.initialize()
+        try:
+            first = await db.insert_evidence("https://a.example", "A", 0.5, {"x": 1, "y": 2})
+            again = await db.insert_evidence("https://a.example", "A", 0.5, {"y": 2, "x": 1})
+            rescored = await db.insert_evidence("https://a.example", "A", 0.7, {"x": 1, "y": 2})
+            bulk = await db.insert_evidence_many([
+                {"url": "https://a.example", "title": "A", "score": 0.5, "facets": {"x": 1, "y": 2}},
+                {"url": "https://b.example", "score": 0.1},
+                {"url": "https://b.example", "score": 0.1},
+            ])
+            assert again == first
+            assert rescored != first
+            assert bulk[0] == first and bulk[1] == bulk[2]
+            assert await db.count_evidence() == 3
+        finally:
+            await db.close()
+
+    asyncio.run(scenario())
+
+
+def test_database_cached_reads_return_independent_dicts(tmp_path):
+    async def scenario():
+        db = Database(str(tmp_path / "aurora.db"))
+        await db.initialize()
+        try:
+            evidence_id = await db.insert_evidence("https://a.example", "A", 0.5, {"k": 1})
+            first = await db.get_evidence(evidence_id)
+            first["facets"]["k"] = 2
+            (listed,) = await db.list_evidence()
+            listed["title"] = "changed"
+            assert (await db.get_evidence(evidence_id))["facets"] == {"k": 1}
+            assert (await db.list_evidence())[0]["title"] == "A"
+        finally:
+            await db.close()
+
+    asyncio.run(scenario())
+
+
+def test_database_rollback_drops_reads_of_uncommitted_rows(tmp_path, monkeypatch):
+    async def scenario():
+        db = Database(str(tmp_path / "aurora.db"))
+        await db.initialize()
+        try:
+            real_executemany = db._db.executemany
+
+            async def executemany_then_read(sql, rows):
+                await real_executemany(sql, rows)
+                # A reader sharing the connection sees (and caches) the open transaction
+                assert await db.count_evidence() == 1
+                raise RuntimeError("disk full")
+
+            monkeypatch.setattr(db._db, "executemany", executemany_then_read)
+            with pytest.raises(RuntimeError):
+                await db.insert_evidence("https://a.example", "A", 0.5, {})
+            assert await db.count_evidence() == 0
+        finally:
+            await db.close()
+
+    asyncio.run(scenario())
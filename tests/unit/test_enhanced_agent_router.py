@@ -0,0 +1,61 @@
+import asyncio
+from collections import deque
+
+from enhanced_agent_router import AgentType, EnhancedAgentRouter, TaskCategory
+
+
+def test_analyze_prompt_matches_overlapping_keywords():
+    router = EnhancedAgentRouter()
+    prompts = ["Research how to type with the mouse", "Implement a class to scrape", "hello"]
+    found = [set(router._analyze_prompt(p)) for p in prompts]
+
+    assert found[0] == {
+        TaskCategory.RESEARCH, TaskCategory.WEB_AUTOMATION, TaskCategory.SYSTEM_CONTROL
+    }
+    assert found[2] == {TaskCategory.GENERAL}
+
+    # The regex fallback must agree with the automaton
+    router._keyword_ac = None
+    assert [set(router._analyze_prompt(p)) for p in prompts] == found
+
+
+def test_route_is_synchronous_and_falls_back_past_failures():
+    router = EnhancedAgentRouter()
+    decision = router.route("scrape and extract the table")
+    assert decision.primary_agent == AgentType.BROWSER
+    assert asyncio.run(router.route_async("scrape and extract the table")) == decision
+
+    for _ in range(6):
+        router.record_result(decision.fallback_chain[0], False, 0.0, "boom")
+    fallback = router.get_fallback_agent(decision.primary_agent, decision)
+    assert fallback not in (decision.primary_agent, decision.fallback_chain[0])
+
+
+def test_route_cache_is_dropped_when_agents_change():
+    router = EnhancedAgentRouter()
+    first = router.route("scrape the page")
+    expected_chain = list(first.fallback_chain)
+    first.fallback_chain.pop(0)
+    again = router.route("scrape the page")
+    # Served from the cache, but as a copy the first caller could not damage
+    assert again is not first and again.fallback_chain == expected_chain
+    assert len(router._route_cache) == 1
+
+    router.disable_agent(first.primary_agent)
+    second = router.route("scrape the page")
+    assert second.primary_agent != first.primary_agent
+
+
+def test_agent_health_recovers_once_failures_age_out():
+    router = EnhancedAgentRouter()
+    metrics = router.metrics[AgentType.BROWSER]
+    for _ in range(10):
+        router.record_result(AgentType.BROWSER, True, 100.0)
+    for _ in range(6):
+        router.record_result(AgentType.BROWSER, False, 0.0, "timeout")
+    assert not metrics.is_healthy
+
+    # Push every failure outside the 5-minute window
+    metrics.failure_times = deque(t - metrics.FAILURE_WINDOW - 1 for t in metrics.failure_times)
+    assert metrics.error_count_5min == 0
+    assert metrics.is_healthy
@@ -0,0 +1,62 @@
+import asyncio
+import json
+
+from heartbeat_monitor import HeartbeatMonitor
+
+
+def test_heartbeat_and_recovery_lines_are_flushed_on_stop(tmp_path, monkeypatch):
+    monkeypatch.setattr(HeartbeatMonitor, "HEARTBEAT_LOG_PATH", str(tmp_path / "logs" / "hb.log"))
+    monkeypatch.setattr(HeartbeatMonitor, "RECOVERY_LOG_PATH", str(tmp_path / "logs" / "rec.log"))
+
+    async def scenario():
+        monitor = HeartbeatMonitor()
+        await monitor.start()
+        for i in range(3):
+            await monitor.record_recovery("cli_agent", "restart", {"attempt": i})
+        await monitor.record_error("cli_agent", "boom")
+        await monitor._write_heartbeat(await monitor.get_health_status())
+        await monitor.stop()
+
+    asyncio.run(scenario())
+
+    events = [json.loads(line) for line in (tmp_path / "logs" / "rec.log").read_text().splitlines()]
+    assert [e["details"]["attempt"] for e in events] == [0, 1, 2]
+    (heartbeat,) = [json.loads(line) for line in (tmp_path / "logs" / "hb.log").read_text().splitlines()]
+    assert heartbeat["type"] == "heartbeat"
+    assert heartbeat["error_counts"] == {"cli_agent": 1}
+    assert len(heartbeat["recent_recovery_events"]) == 3
+
+
+def test_heartbeat_loop_ticks_and_stops_without_cancellation(tmp_path, monkeypatch):
+    monkeypatch.setattr(HeartbeatMonitor, "HEARTBEAT_LOG_PATH", str(tmp_path / "hb.log"))
+    monkeypatch.setattr(HeartbeatMonitor, "HEARTBEAT_INTERVAL", 0.02)
+
+    async def scenario():
+        monitor = HeartbeatMonitor()
+        await monitor.start()
+        await asyncio.sleep(0.1)
+        task = monitor._heartbeat_task
+        await monitor.stop()
+        assert task.done() and not task.cancelled()
+
+    asyncio.run(scenario())
+    assert len((tmp_path / "hb.log").read_text().splitlines()) >= 2
+
+
+def test_component_health_reports_each_probe_independently():
+    class CLI:
+        def status(self):
+            return {"claude": {"available": True}}
+
+    class Input:
+        def get_health_status(self):
+            raise RuntimeError("probe failed")
+
+    async def scenario():
+        monitor = HeartbeatMonitor()
+        return await monitor.get_component_health(cli_agent=CLI(), input_agent=Input())
+
+    health = asyncio.run(scenario())
+    assert health["components"]["cli_agent"] == {"status": "healthy", "agents": {"claude": {"available": True}}}
+    assert health["components"]["input_agent"] == {"status": "error", "error": "probe failed"}
+    assert health["error_counts"] == {"input_agent": 1}